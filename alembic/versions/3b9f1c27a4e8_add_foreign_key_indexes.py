@@ -0,0 +1,54 @@
+"""add foreign key indexes
+
+Revision ID: 3b9f1c27a4e8
+Revises: d6865df5f660
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c27a4e8'
+down_revision: Union[str, Sequence[str], None] = 'd6865df5f660'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# обратные стороны связей: по ним фильтруют selectinload и каскадные удаления
+INDEXES = (
+    ('ix_orders_post_o2m_id', 'orders', 'post_o2m_id'),
+    ('ix_profiles_owner_id', 'profiles', 'owner_id'),
+    ('ix_comments_role_o2m_id', 'comments', 'role_o2m_id'),
+    ('ix_posts_orders_m2m_order_id', 'posts_orders_m2m', 'order_id'),
+    ('ix_roles_comments_m2m_comment_id', 'roles_comments_m2m', 'comment_id'),
+    ('ix_user_profile_profile_id', 'user_profile', 'profile_id'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY не блокирует запись, но не работает внутри транзакции
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
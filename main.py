@@ -1,9 +1,63 @@
+import os
+import shutil
+import tempfile
+
 import uvicorn
-import asyncio
 
+from src.config.config import Settings
+
+
+def worker_count(settings: Settings) -> int:
+    if settings.server_workers > 0:
+        return settings.server_workers
+
+    # учитываем ограничение CPU контейнера через affinity, если оно есть
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def prepare_metrics_dir(workers: int) -> None:
+    """
+    С несколькими воркерами prometheus_client пишет метрики в общий
+    каталог, а /metrics любого воркера агрегирует их. Каталог очищается
+    при старте, чтобы не подхватить файлы прошлого запуска.
+    """
+    if workers <= 1:
+        return
+
+    path = os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR",
+        os.path.join(tempfile.gettempdir(), "prometheus_multiproc"),
+    )
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+
+
+def main() -> None:
+    settings = Settings()
+    workers = worker_count(settings)
+    prepare_metrics_dir(workers)
+
+    uvicorn.run(
+        "application.application:get_app",
+        factory=True,
+        app_dir="src",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        backlog=settings.server_backlog,
+        limit_concurrency=settings.server_limit_concurrency,
+        limit_max_requests=settings.server_limit_max_requests,
+        timeout_keep_alive=settings.server_keep_alive,
+        timeout_graceful_shutdown=settings.server_graceful_shutdown_timeout,
+        proxy_headers=True,
+        access_log=settings.server_access_log,
+    )
 
-async def main() -> None:
-    uvicorn.run('application:get_app', host='localhost', port=8000, reload=True, factory=True)
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    main()
@@ -1,17 +1,129 @@
+import asyncio
+import logging
+import signal
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import UJSONResponse
 
+from application.warmup import warm_up
+from cache.cache import cache
+from config.config import Settings
+from config.redis import redis
 from exceptions.http import register_exception_handlers
+from metrics.database import instrument_engine
+from metrics.local_cache import collect_local_cache_metrics
+from metrics.metrics import mark_worker_dead
+from metrics.pool import collect_pool_metrics
+from metrics.profiler import profile_to_file
+from middlewares.compression import CompressionMiddleware
+from middlewares.metrics import MetricsMiddleware
+from middlewares.profiling import ProfilingMiddleware
+from middlewares.query_budget import QueryBudgetMiddleware
+from middlewares.read_your_writes import ReadYourWritesMiddleware
+from repositories.fast import close_pools, open_pools
+from services.health import monitor_loop_lag
+from src.session import (
+    engine,
+    monitor_replica_lag,
+    primary_read_session_maker,
+    read_session_maker,
+    replica_engine,
+)
+from src.routes.debug_router import router as debug_router
+from src.routes.healthcheck_router import router as healthcheck_router
+from src.routes.metrics_router import router as metrics_router
 from src.routes.users_profiles import router as users_profiles_router
 from src.routes.roles_comments import router as roles_comments_router
 from src.routes.posts_orders import router as posts_orders_router
 
+logger = logging.getLogger(__name__)
+
+settings = Settings()
+
+instrument_engine(engine)
+if replica_engine is not None:
+    instrument_engine(replica_engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+
+    engines = [engine] if replica_engine is None else [engine, replica_engine]
+    if settings.fast_path_repositories:
+        await open_pools(engines)
+
+    tasks = [
+        asyncio.create_task(cache.listen_invalidations()),
+        asyncio.create_task(monitor_loop_lag()),
+        asyncio.create_task(collect_pool_metrics(settings.metrics_pool_interval)),
+        asyncio.create_task(collect_local_cache_metrics(settings.metrics_local_cache_interval)),
+    ]
+    if replica_engine is not None:
+        tasks.append(asyncio.create_task(monitor_replica_lag()))
+
+    # kill -USR2 <pid воркера> пишет профиль event loop в PROFILER_OUTPUT_DIR
+    def start_profile() -> None:
+        tasks.append(asyncio.create_task(profile_to_file(
+            settings.profiler_output_dir,
+            settings.profiler_signal_duration,
+            settings.profiler_interval,
+        )))
+
+    # обработчики сигналов работают только в главном потоке; в TestClient
+    # и прочих обвязках цикл живёт в другом потоке — там обходимся без них
+    loop = asyncio.get_running_loop()
+    profile_signal = False
+    if hasattr(signal, "SIGUSR2"):
+        try:
+            loop.add_signal_handler(signal.SIGUSR2, start_profile)
+            profile_signal = True
+        except (ValueError, RuntimeError, NotImplementedError):
+            logger.info("SIGUSR2 profiling is unavailable in this event loop")
+
+    if settings.warmup_enabled:
+        session_makers = [primary_read_session_maker]
+        if read_session_maker is not primary_read_session_maker:
+            session_makers.append(read_session_maker)
+
+        try:
+            await asyncio.wait_for(
+                warm_up(engines, session_makers),
+                timeout=settings.warmup_timeout,
+            )
+        except Exception:
+            # не валим старт: воркер поднимется холодным
+            logger.exception("Startup warm-up failed")
+
+    app.state.ready = True
+
+    try:
+        yield
+    finally:
+        if profile_signal:
+            loop.remove_signal_handler(signal.SIGUSR2)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+        await close_pools()
+        await engine.dispose()
+        if replica_engine is not None:
+            await replica_engine.dispose()
+        await redis.aclose()
+        mark_worker_dead()
+
+
 def get_app() -> FastAPI:
     app = FastAPI(
         docs_url="/docs",
         openapi_url="/openapi.json",
         default_response_class=UJSONResponse,
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -21,11 +133,39 @@ def get_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_min_size,
+        encodings=tuple(settings.compression_encodings),
+    )
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window=settings.read_your_writes_window,
+    )
+    if settings.query_budget_mode != "off":
+        app.add_middleware(
+            QueryBudgetMiddleware,
+            budget=settings.query_budget,
+            mode=settings.query_budget_mode,
+            overrides=settings.query_budget_overrides,
+            repeat_threshold=settings.query_repeat_threshold,
+        )
+    if settings.admin_token:
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=settings.admin_token,
+            output_dir=settings.profiler_output_dir,
+            interval=settings.profiler_interval,
+        )
+    app.add_middleware(MetricsMiddleware)
 
     register_exception_handlers(app)
 
-    app.include_router(users_profiles_router, prefix="api")
-    app.include_router(roles_comments_router, prefix="api")
-    app.include_router(posts_orders_router, prefix="api")
+    app.include_router(healthcheck_router)
+    app.include_router(metrics_router)
+    app.include_router(debug_router)
+    app.include_router(users_profiles_router, prefix="/api")
+    app.include_router(roles_comments_router, prefix="/api")
+    app.include_router(posts_orders_router, prefix="/api")
 
     return app
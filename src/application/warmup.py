@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+from config.config import Settings
+from config.redis import redis
+from exceptions.common import NotFoundError
+from repositories.comments import CommentRepository
+from repositories.orders import OrderRepository
+from repositories.posts import PostRepository
+from repositories.profiles import ProfileRepository
+from repositories.roles import RoleRepository
+from repositories.users import UserRepository
+from services.comments import get_comment
+from services.orders import get_order
+from services.posts import get_post
+from services.profiles import get_profile
+from services.roles import get_role
+from services.users import get_user
+
+logger = logging.getLogger(__name__)
+
+settings = Settings()
+
+REPOSITORIES = (
+    CommentRepository,
+    OrderRepository,
+    PostRepository,
+    ProfileRepository,
+    RoleRepository,
+    UserRepository,
+)
+
+GETTERS = {
+    "comment": get_comment,
+    "order": get_order,
+    "post": get_post,
+    "profile": get_profile,
+    "role": get_role,
+    "user": get_user,
+}
+
+
+async def warm_engine(engine: AsyncEngine, connections: int) -> None:
+    """Открывает connections соединений разом, после чего они остаются в пуле."""
+    if isinstance(engine.pool, NullPool):
+        return
+
+    async def ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(connections)))
+
+
+async def warm_redis(connections: int) -> None:
+    await asyncio.gather(*(redis.ping() for _ in range(connections)))
+
+
+async def warm_statement_cache(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    """
+    Выполняет запросы всех репозиториев с несуществующим id: это заполняет
+    кэш скомпилированных выражений SQLAlchemy и подготовленные выражения
+    asyncpg на соединении.
+    """
+    placeholder = UUID(int=0)
+
+    async with session_maker() as session:
+        for repository_class in REPOSITORIES:
+            repository = repository_class(session)
+            await repository.get_by_id(placeholder)
+            await repository.read_by_id(placeholder)
+            await repository.read_many([placeholder])
+            await repository.read_page(1)
+
+
+async def prefill_cache(session_maker: async_sessionmaker[AsyncSession], keys: list[str]) -> None:
+    async with session_maker() as session:
+        for key in keys:
+            prefix, _, entity_id = key.partition(":")
+            getter = GETTERS.get(prefix)
+            if getter is None:
+                logger.warning("Unknown cache prefill key %s", key)
+                continue
+
+            try:
+                await getter(session, UUID(entity_id))
+            except (NotFoundError, ValueError):
+                logger.warning("Skipping cache prefill key %s", key)
+
+
+async def warm_up(
+    engines: list[AsyncEngine],
+    session_makers: list[async_sessionmaker[AsyncSession]],
+) -> None:
+    """
+    session_makers — по одному на движок: кэш скомпилированных выражений
+    у каждого движка свой. Первый (primary) заполняет и кэш ответов.
+    """
+    steps = [
+        *(warm_engine(engine, settings.warmup_db_connections) for engine in engines),
+        warm_redis(settings.warmup_redis_connections),
+    ]
+    await asyncio.gather(*steps)
+
+    for session_maker in session_makers:
+        await warm_statement_cache(session_maker)
+
+    if settings.cache_prefill_keys:
+        await prefill_cache(session_makers[0], settings.cache_prefill_keys)
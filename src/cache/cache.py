@@ -0,0 +1,431 @@
+import asyncio
+import logging
+import math
+import random
+import time
+import uuid
+from functools import partial
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterable
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache.codecs import CacheCodec
+from cache.entry import CacheEntry, CorruptEntry
+from cache.local import LocalCache
+from config.redis import redis, settings, CACHE_TTL
+from metrics.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[BaseModel]]
+BatchLoader = Callable[[list[UUID]], Awaitable[list[BaseModel]]]
+
+# откуда читает текущий запрос ("primary" или "replica"); задаёт get_read_session
+read_source: ContextVar[str] = ContextVar("cache_read_source", default="primary")
+
+# ключи, изменённые в транзакции сессии: инвалидируются после коммита
+PENDING_INVALIDATIONS = "cache_invalidations"
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class TwoTierCache:
+    """Двухуровневый кэш: локальный LRU воркера перед общим Redis."""
+
+    def __init__(
+        self,
+        redis: Redis,
+        local: LocalCache,
+        codec: CacheCodec,
+        ttl: int,
+        lock_ttl: float,
+        lock_wait: float,
+        lock_poll_interval: float,
+        invalidation_channel: str,
+        early_refresh_beta: float = 0.0,
+        replica_local_ttl: float = 1.0,
+        namespace: str = "",
+    ):
+        self.redis = redis
+        self.local = local
+        self.codec = codec
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self.lock_poll_interval = lock_poll_interval
+        self.invalidation_channel = invalidation_channel
+        self.early_refresh_beta = early_refresh_beta
+        self.replica_local_ttl = replica_local_ttl
+        self.namespace = namespace
+
+        # ключ полёта включает источник: запрос, закреплённый за primary,
+        # не должен получить результат загрузки с реплики
+        self._inflight: dict[tuple[str, str], asyncio.Task[CacheEntry]] = {}
+        self._load_time: dict[str, float] = {}
+        self._release_lock = redis.register_script(RELEASE_LOCK_SCRIPT)
+
+    async def get_many(self, keys: list[str]) -> dict[str, CacheEntry]:
+        found = {}
+        remote = []
+
+        for key in keys:
+            entry = self.local.get(key)
+            if entry is None:
+                remote.append(key)
+            else:
+                found[key] = entry
+
+        if remote:
+            try:
+                values = await self.redis.mget([self._redis_key(key) for key in remote])
+            except RedisError:
+                # Redis недоступен: промахи догрузятся из БД
+                logger.warning("Cache read failed for %d keys", len(remote), exc_info=True)
+                values = [None] * len(remote)
+
+            for key, raw in zip(remote, values):
+                entry = self._remember(key, raw)
+                if entry is not None:
+                    found[key] = entry
+
+        # тела пакетному ответу нужны сразу: повреждённая запись — промах,
+        # загруженная заново перезапишет её в Redis
+        for key, entry in list(found.items()):
+            try:
+                entry.body
+            except CorruptEntry:
+                self.local.delete(key)
+                del found[key]
+
+        return found
+
+    async def set(self, key: str, data: BaseModel, ttl: int | None = None) -> None:
+        await self._store(key, data.model_dump_json().encode(), ttl)
+        await self.redis.publish(self.invalidation_channel, key)
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+        await self.redis.delete(self._redis_key(key), key)
+        await self.redis.publish(self.invalidation_channel, key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+
+        for key in keys:
+            self.local.delete(key)
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            # старые воркеры во время выкладки пишут под ключами без префикса
+            pipe.delete(*(self._redis_key(key) for key in keys), *keys)
+            for key in keys:
+                pipe.publish(self.invalidation_channel, key)
+            await pipe.execute()
+
+    def invalidate_on_commit(self, session: AsyncSession, keys: Iterable[str]) -> None:
+        """
+        Откладывает удаление ключей до коммита сессии: раньше конкурентный
+        промах перечитал бы ещё старую строку и вернул её в Redis на весь
+        TTL, а при откате в кэше остались бы несохранённые данные.
+        """
+        session.info.setdefault(PENDING_INVALIDATIONS, set()).update(keys)
+
+    async def invalidate_committed(self, session: AsyncSession) -> None:
+        """Удаляет и рассылает ключи, отложенные invalidate_on_commit."""
+        keys = session.info.pop(PENDING_INVALIDATIONS, None)
+        if not keys:
+            return
+
+        try:
+            await self.delete_many(sorted(keys))
+        except RedisError:
+            # запись уже сохранена: ответ не портим, ключи доживут до TTL
+            logger.warning("Cache invalidation failed for %d keys", len(keys), exc_info=True)
+
+    async def listen_invalidations(self, retry_delay: float = 1.0) -> None:
+        """
+        Фоновая подписка воркера на канал инвалидаций: удаляет из
+        локального LRU ключи, изменённые другими воркерами.
+        """
+        reconnect = False
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.invalidation_channel)
+                    # пока подписка была разорвана, сообщения могли потеряться
+                    if reconnect:
+                        self.local.clear()
+                    reconnect = True
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.local.delete(message["data"].decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation subscriber failed, reconnecting")
+                await asyncio.sleep(retry_delay)
+
+    async def get_or_load(self, key: str, loader: Loader) -> CacheEntry:
+        """
+        Читает ключ, а при промахе загружает его ровно один раз:
+        конкурентные запросы воркера ждут одну задачу, а воркеры
+        между собой договариваются через блокировку в Redis.
+        """
+        entry = self.local.get(key)
+        if entry is not None:
+            self._record(key, "hit")
+            return entry
+
+        flight = (read_source.get(), key)
+        task = self._inflight.get(flight)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, loader))
+            self._inflight[flight] = task
+            task.add_done_callback(lambda _: self._inflight.pop(flight, None))
+
+        return await asyncio.shield(task)
+
+    async def get_many_or_load(
+        self,
+        prefix: str,
+        ids: Iterable[UUID],
+        loader: BatchLoader,
+    ) -> list[CacheEntry]:
+        """
+        Пакетное чтение: один MGET в Redis, одна загрузка всех промахов
+        и одна конвейерная запись обратно. Порядок соответствует ids,
+        отсутствующие сущности пропускаются.
+        """
+        keys = {id_: f"{prefix}:{id_}" for id_ in ids}
+        found = await self.get_many(list(keys.values()))
+
+        missing = [id_ for id_, key in keys.items() if key not in found]
+        CACHE_REQUESTS.labels(prefix, "hit").inc(len(keys) - len(missing))
+        CACHE_REQUESTS.labels(prefix, "miss").inc(len(missing))
+        if missing:
+            loaded = {
+                f"{prefix}:{item.id}": item.model_dump_json().encode()
+                for item in await loader(missing)
+            }
+            if read_source.get() == "replica":
+                found.update(
+                    (key, self._store_local(key, body)) for key, body in loaded.items()
+                )
+            else:
+                found.update(await self._store_many(loaded))
+
+        return [found[key] for key in keys.values() if key in found]
+
+    async def _fetch(self, key: str, loader: Loader) -> CacheEntry:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                redis_key = self._redis_key(key)
+                raw, pttl = await pipe.get(redis_key).pttl(redis_key).execute()
+        except RedisError:
+            # Redis недоступен: отдаём данные из БД в обход кэша
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            self._record(key, "error")
+            return CacheEntry.from_body((await loader()).model_dump_json().encode())
+
+        entry = self._remember(key, raw)
+        if entry is not None and not self._should_refresh(key, pttl):
+            self._record(key, "hit")
+            return entry
+
+        self._record(key, "miss")
+
+        if read_source.get() == "replica":
+            # данные реплики могут быть старше записи, уже удалённой из Redis:
+            # в общий кэш их не пишем, и блокировка загрузчика не нужна
+            return self._store_local(key, (await loader()).model_dump_json().encode())
+
+        lock_key = f"lock:{self._redis_key(key)}"
+        token = uuid.uuid4().hex
+        locked = await self.redis.set(
+            lock_key,
+            token,
+            nx=True,
+            px=int(self.lock_ttl * 1000),
+        )
+
+        if not locked:
+            if entry is None:
+                entry = await self._wait_for(key, lock_key)
+
+            if entry is not None:
+                return entry
+
+        try:
+            return await self._load(key, loader)
+        finally:
+            if locked:
+                await self._release_lock(keys=[lock_key], args=[token])
+
+    async def _load(self, key: str, loader: Loader) -> CacheEntry:
+        started = time.monotonic()
+        data = await loader()
+        body = data.model_dump_json().encode()
+        self._load_time[self._prefix(key)] = time.monotonic() - started
+
+        return await self._store(key, body)
+
+    async def _store(self, key: str, body: bytes, ttl: int | None = None) -> CacheEntry:
+        entry = CacheEntry.from_body(body)
+        await self.redis.set(
+            self._redis_key(key),
+            self.codec.encode(body, entry.etag),
+            ex=ttl or self.ttl,
+        )
+        self.local.set(key, entry)
+
+        return entry
+
+    def _store_local(self, key: str, body: bytes) -> CacheEntry:
+        entry = CacheEntry.from_body(body)
+        self.local.set(key, entry, ttl=self.replica_local_ttl)
+
+        return entry
+
+    async def _store_many(
+        self,
+        values: dict[str, bytes],
+        ttl: int | None = None,
+    ) -> dict[str, CacheEntry]:
+        if not values:
+            return {}
+
+        entries = {key: CacheEntry.from_body(body) for key, body in values.items()}
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.mset({
+                    self._redis_key(key): self.codec.encode(entry.body, entry.etag)
+                    for key, entry in entries.items()
+                })
+                for key in entries:
+                    pipe.expire(self._redis_key(key), ttl or self.ttl)
+                await pipe.execute()
+        except RedisError:
+            # без Redis воркер не узнает об инвалидациях: в LRU не кладём
+            logger.warning("Cache write failed for %d keys", len(entries), exc_info=True)
+            return entries
+
+        for key, entry in entries.items():
+            self.local.set(key, entry)
+
+        return entries
+
+    async def _wait_for(self, key: str, lock_key: str) -> CacheEntry | None:
+        deadline = time.monotonic() + self.lock_wait
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.lock_poll_interval)
+
+            async with self.redis.pipeline(transaction=False) as pipe:
+                raw, lock_held = await pipe.get(self._redis_key(key)).exists(lock_key).execute()
+
+            entry = self._remember(key, raw)
+            if entry is not None or not lock_held:
+                return entry
+
+        return None
+
+    def _remember(self, key: str, raw: bytes | None) -> CacheEntry | None:
+        """
+        Разбирает запись из Redis и кладёт её в локальный LRU. Сразу
+        читается только заголовок с ETag, тело — при первом обращении.
+        """
+        if raw is None:
+            return None
+
+        decoded = self.codec.decode(raw)
+        if decoded is None:
+            return None
+
+        etag, load_body = decoded
+        load_body = partial(self._load_body, key, load_body)
+        if etag is not None:
+            entry = CacheEntry(etag, load_body=load_body)
+        else:
+            # у старых записей ETag нет: его считают по телу
+            try:
+                entry = CacheEntry.from_body(load_body())
+            except CorruptEntry:
+                return None
+
+        self.local.set(key, entry)
+
+        return entry
+
+    @staticmethod
+    def _load_body(key: str, load_body: Callable[[], bytes]) -> bytes:
+        try:
+            return load_body()
+        except Exception as error:
+            logger.warning("Failed to decode cache entry %s", key, exc_info=True)
+            raise CorruptEntry(key) from error
+
+    async def discard(self, key: str) -> None:
+        """Выбрасывает повреждённую запись, чтобы следующее чтение стало промахом."""
+        self.local.delete(key)
+        try:
+            await self.redis.delete(self._redis_key(key))
+        except RedisError:
+            logger.warning("Cache delete failed for %s", key, exc_info=True)
+
+    def _should_refresh(self, key: str, pttl: int) -> bool:
+        # XFetch: чем ближе истечение и дороже загрузка, тем вероятнее
+        # досрочное обновление одним из читателей
+        if self.early_refresh_beta <= 0 or pttl is None or pttl < 0:
+            return False
+
+        delta = self._load_time.get(self._prefix(key))
+        if not delta:
+            return False
+
+        gap = -delta * self.early_refresh_beta * math.log(1.0 - random.random())
+        return gap >= pttl / 1000
+
+    def _record(self, key: str, result: str) -> None:
+        CACHE_REQUESTS.labels(self._prefix(key), result).inc()
+
+    def _redis_key(self, key: str) -> str:
+        # в LRU и в канале инвалидаций ключи без префикса
+        return f"{self.namespace}:{key}" if self.namespace else key
+
+    @staticmethod
+    def _prefix(key: str) -> str:
+        return key.partition(":")[0]
+
+
+cache = TwoTierCache(
+    redis=redis,
+    local=LocalCache(
+        max_size=settings.local_cache_size,
+        ttl=settings.local_cache_ttl,
+    ),
+    codec=CacheCodec(
+        format=settings.cache_format,
+        compression=settings.cache_compression,
+        compression_min_size=settings.cache_compression_min_size,
+    ),
+    ttl=CACHE_TTL,
+    lock_ttl=settings.cache_lock_ttl,
+    lock_wait=settings.cache_lock_wait,
+    lock_poll_interval=settings.cache_lock_poll_interval,
+    invalidation_channel=settings.cache_invalidation_channel,
+    early_refresh_beta=settings.cache_early_refresh_beta,
+    replica_local_ttl=settings.local_cache_replica_ttl,
+    namespace=settings.cache_namespace,
+)
@@ -0,0 +1,142 @@
+from functools import partial
+from typing import Callable
+
+import pydantic_core
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+# 0xC1 не встречается ни в начале UTF-8 JSON, ни в msgpack, поэтому
+# записи без заголовка (старый формат — голый JSON) легко отличить
+MAGIC = 0xC1
+VERSION = 2
+
+FORMATS = {"json": 0, "msgpack": 1}
+COMPRESSIONS = {"none": 0, "zstd": 1, "lz4": 2}
+
+
+class CacheCodec:
+    """
+    Кодирует JSON-тело записи для хранения в Redis.
+
+    Заголовок v2: MAGIC | версия | формат | сжатие | длина ETag | ETag.
+    Записи v1 (без ETag) и записи без заголовка по-прежнему читаются,
+    а декодер понимает любой известный формат независимо от текущих
+    настроек, так что их можно менять без сброса кэша.
+    """
+
+    def __init__(
+        self,
+        format: str = "json",
+        compression: str = "none",
+        compression_min_size: int = 1024,
+        compression_level: int = 3,
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown cache format: {format}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if format == "msgpack" and msgpack is None:
+            raise RuntimeError("Cache format 'msgpack' requires the msgpack package")
+        if compression == "zstd" and zstandard is None:
+            raise RuntimeError("Cache compression 'zstd' requires the zstandard package")
+        if compression == "lz4" and lz4 is None:
+            raise RuntimeError("Cache compression 'lz4' requires the lz4 package")
+
+        self.format = format
+        self.compression = compression
+        self.compression_min_size = compression_min_size
+        self.compression_level = compression_level
+
+    def encode(self, body: bytes, etag: str) -> bytes:
+        payload = body
+        if self.format == "msgpack":
+            payload = msgpack.packb(pydantic_core.from_json(body))
+
+        compression = "none"
+        if self.compression != "none" and len(payload) >= self.compression_min_size:
+            payload = self._compress(payload)
+            compression = self.compression
+
+        etag_bytes = etag.encode()
+        header = bytes((
+            MAGIC,
+            VERSION,
+            FORMATS[self.format],
+            COMPRESSIONS[compression],
+            len(etag_bytes),
+        ))
+        return header + etag_bytes + payload
+
+    def decode(self, raw: bytes) -> tuple[str | None, Callable[[], bytes]] | None:
+        """
+        Разбирает только заголовок: возвращает сохранённый ETag (None для
+        старых записей) и функцию, которая декодирует тело при вызове и
+        поднимает исключение на повреждённом содержимом. None — заголовок
+        неизвестного, недоступного или повреждённого формата: для кэша
+        это промах, а не ошибка запроса.
+        """
+        if not raw or raw[0] != MAGIC:
+            return None, partial(bytes, raw)
+
+        if len(raw) < 4 or raw[1] not in (1, 2):
+            return None
+
+        format, compression = raw[2], raw[3]
+        if not self._supported(format, compression):
+            return None
+
+        if raw[1] == 1:
+            etag, offset = None, 4
+        else:
+            if len(raw) < 5 or len(raw) < 5 + raw[4]:
+                return None
+            offset = 5 + raw[4]
+
+        if raw[1] == 2:
+            try:
+                etag = raw[5:offset].decode()
+            except UnicodeDecodeError:
+                return None
+
+        return etag, partial(self._decode_payload, format, compression, raw[offset:])
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(payload)
+        return lz4.frame.compress(payload, compression_level=self.compression_level)
+
+    @staticmethod
+    def _supported(format: int, compression: int) -> bool:
+        if format == FORMATS["msgpack"] and msgpack is None:
+            return False
+        if compression == COMPRESSIONS["zstd"] and zstandard is None:
+            return False
+        if compression == COMPRESSIONS["lz4"] and lz4 is None:
+            return False
+
+        return format in FORMATS.values() and compression in COMPRESSIONS.values()
+
+    @staticmethod
+    def _decode_payload(format: int, compression: int, payload: bytes) -> bytes:
+        if compression == COMPRESSIONS["zstd"]:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        elif compression == COMPRESSIONS["lz4"]:
+            payload = lz4.frame.decompress(payload)
+
+        if format == FORMATS["msgpack"]:
+            return pydantic_core.to_json(msgpack.unpackb(payload))
+
+        return payload
@@ -0,0 +1,88 @@
+import hashlib
+from typing import Callable
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class CorruptEntry(Exception):
+    """Тело записи из Redis не декодируется; для кэша это промах."""
+
+    def __init__(self, key: str):
+        super().__init__(key)
+        self.key = key
+
+
+class CacheEntry:
+    """
+    Готовое тело ответа и его ETag. Тело записи, прочитанной из Redis,
+    декодируется только при первом обращении: для 304 оно не нужно.
+    """
+
+    __slots__ = ("etag", "_body", "_load_body", "_raw_headers", "_variants")
+
+    def __init__(
+        self,
+        etag: str,
+        body: bytes | None = None,
+        load_body: Callable[[], bytes] | None = None,
+    ):
+        self.etag = etag
+        self._body = body
+        self._load_body = load_body
+        self._raw_headers: tuple[tuple[bytes, bytes], ...] | None = None
+        self._variants: dict[str, tuple[bytes, tuple[tuple[bytes, bytes], ...]]] = {}
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CacheEntry":
+        return cls(make_etag(body), body=body)
+
+    @property
+    def body(self) -> bytes:
+        # load_body поднимает CorruptEntry, если запись повреждена
+        if self._body is None:
+            self._body = self._load_body()
+            self._load_body = None
+        return self._body
+
+    @property
+    def raw_headers(self) -> tuple[tuple[bytes, bytes], ...]:
+        if self._raw_headers is None:
+            self._raw_headers = (
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(self.body)).encode()),
+                *self.validators(),
+            )
+        return self._raw_headers
+
+    def validators(self, encoding: str | None = None) -> tuple[tuple[bytes, bytes], ...]:
+        """ETag и Vary представления: одни и те же в ответах 200 и 304."""
+        etag = self.etag.encode()
+        if encoding is not None:
+            # у сжатого представления другие байты: ETag только слабый
+            etag = b"W/" + etag
+
+        return (b"etag", etag), (b"vary", b"Accept-Encoding")
+
+    def encoded(
+        self,
+        encoding: str,
+        compress: Callable[[bytes], bytes],
+    ) -> tuple[bytes, tuple[tuple[bytes, bytes], ...]]:
+        """Сжатое тело с заголовками; сжимается один раз на запись в воркере."""
+        variant = self._variants.get(encoding)
+        if variant is None:
+            body = compress(self.body)
+            variant = (
+                body,
+                (
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"content-encoding", encoding.encode()),
+                    *self.validators(encoding),
+                ),
+            )
+            self._variants[encoding] = variant
+
+        return variant
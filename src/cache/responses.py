@@ -0,0 +1,99 @@
+from functools import partial
+from typing import Awaitable, Callable
+
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import Response
+
+from cache.cache import cache
+from cache.entry import CacheEntry, CorruptEntry
+from config.config import Settings
+from middlewares.compression import compress, negotiate_encoding
+
+settings = Settings()
+
+
+class CachedResponse(Response):
+    """Отдаёт запись кэша как есть, без валидации и повторной сериализации."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        entry: CacheEntry,
+        encoding: str | None = None,
+        status_code: int = 200,
+    ):
+        if encoding is None:
+            body, raw_headers = entry.body, entry.raw_headers
+        else:
+            body, raw_headers = entry.encoded(encoding, partial(compress, encoding))
+
+        self.status_code = status_code
+        self.body = body
+        self.background: BackgroundTask | None = None
+        # middleware дописывают заголовки в этот список, общий кортеж не трогаем
+        self.raw_headers = list(raw_headers)
+
+
+def cached_list_response(entries: list[CacheEntry]) -> Response:
+    return Response(
+        content=b"[" + b",".join(entry.body for entry in entries) + b"]",
+        media_type="application/json",
+    )
+
+
+def matching_validator(if_none_match: str | None, etag: str) -> str | None:
+    """Кандидат из If-None-Match, совпавший с etag, или None."""
+    if not if_none_match:
+        return None
+
+    # для If-None-Match действует слабое сравнение (RFC 9110, 13.1.2)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return candidate
+
+    return None
+
+
+def negotiated_encoding(request: Request) -> str | None:
+    if not settings.cache_precompress:
+        return None
+
+    return negotiate_encoding(
+        request.headers.get("accept-encoding", ""),
+        tuple(settings.compression_encodings),
+    )
+
+
+async def cached_response(
+    request: Request,
+    get_entry: Callable[[], Awaitable[CacheEntry]],
+) -> Response:
+    """
+    Ответ по записи кэша. Для 304 хватает ETag, тело не декодируется;
+    повреждённое тело считается промахом: запись выбрасывается и
+    читается заново.
+    """
+    entry = await get_entry()
+    validator = matching_validator(request.headers.get("if-none-match"), entry.etag)
+    if validator is not None:
+        # слабый ETag клиент получил со сжатым представлением: подтверждаем
+        # его тем же вариантом ETag и тем же Vary, что были в ответе 200
+        encoding = negotiated_encoding(request) if validator.startswith("W/") else None
+        response = Response(status_code=304)
+        response.raw_headers.extend(entry.validators(encoding))
+        return response
+
+    try:
+        entry.body
+    except CorruptEntry as error:
+        await cache.discard(error.key)
+        entry = await get_entry()
+
+    encoding = None
+    if len(entry.body) >= settings.compression_min_size:
+        encoding = negotiated_encoding(request)
+
+    return CachedResponse(entry, encoding)
@@ -6,7 +6,46 @@ from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
+    server_host: str = Field(default="0.0.0.0", env="SERVER_HOST")
+    server_port: int = Field(default=8000, env="SERVER_PORT")
+    # 0 — по числу доступных процессу CPU
+    server_workers: int = Field(default=0, env="SERVER_WORKERS")
+    server_backlog: int = Field(default=2048, env="SERVER_BACKLOG")
+    server_limit_concurrency: int | None = Field(default=None, env="SERVER_LIMIT_CONCURRENCY")
+    server_limit_max_requests: int | None = Field(default=None, env="SERVER_LIMIT_MAX_REQUESTS")
+    server_keep_alive: int = Field(default=5, env="SERVER_KEEP_ALIVE")
+    server_graceful_shutdown_timeout: int = Field(default=30, env="SERVER_GRACEFUL_SHUTDOWN_TIMEOUT")
+    server_access_log: bool = Field(default=False, env="SERVER_ACCESS_LOG")
+
     postgres_url: str = Field(env="PostgresDsn")
+    postgres_replica_url: str | None = Field(default=None, env="POSTGRES_REPLICA_URL")
+
+    read_your_writes_window: float = Field(default=5.0, env="READ_YOUR_WRITES_WINDOW")
+    replica_max_lag: float = Field(default=1.0, env="REPLICA_MAX_LAG")
+    replica_lag_check_interval: float = Field(default=1.0, env="REPLICA_LAG_CHECK_INTERVAL")
+
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=10.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=30 * 60, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, env="DB_POOL_PRE_PING")
+    db_statement_cache_size: int = Field(default=500, env="DB_STATEMENT_CACHE_SIZE")
+    # кэш скомпилированного SQL в SQLAlchemy; должен вмещать все варианты
+    # запросов репозиториев, иначе компиляция повторяется под нагрузкой
+    db_query_cache_size: int = Field(default=1200, env="DB_QUERY_CACHE_SIZE")
+    db_command_timeout: float | None = Field(default=None, env="DB_COMMAND_TIMEOUT")
+    db_server_settings: dict[str, str] = Field(
+        default={"application_name": "fastapiproject", "jit": "off"},
+        env="DB_SERVER_SETTINGS",
+    )
+    # внешний пулер (PgBouncer в transaction mode): без своего пула
+    # и без подготовленных выражений
+    db_external_pooler: bool = Field(default=False, env="DB_EXTERNAL_POOLER")
+    # например ["PostRepository", "UserRepository"]: чтения по id через asyncpg
+    fast_path_repositories: list[str] = Field(default=[], env="FAST_PATH_REPOSITORIES")
+    # отдельный от SQLAlchemy пул: до fast_path_pool_size соединений на базу сверх основного
+    fast_path_pool_size: int = Field(default=10, env="FAST_PATH_POOL_SIZE")
+    fast_path_pool_min_size: int = Field(default=1, env="FAST_PATH_POOL_MIN_SIZE")
 
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
@@ -14,5 +53,72 @@ class Settings(BaseSettings):
 
     cache_ttl: int = Field(default=60 * 60, env="CACHE_TTL")
 
+    local_cache_size: int = Field(default=10_000, env="LOCAL_CACHE_SIZE")
+    local_cache_ttl: float = Field(default=5.0, env="LOCAL_CACHE_TTL")
+    # прочитанное с реплики может отставать: оно живёт только в LRU воркера
+    local_cache_replica_ttl: float = Field(default=1.0, env="LOCAL_CACHE_REPLICA_TTL")
+
+    cache_lock_ttl: float = Field(default=5.0, env="CACHE_LOCK_TTL")
+    cache_lock_wait: float = Field(default=2.0, env="CACHE_LOCK_WAIT")
+    cache_lock_poll_interval: float = Field(default=0.02, env="CACHE_LOCK_POLL_INTERVAL")
+    cache_early_refresh_beta: float = Field(default=0.0, env="CACHE_EARLY_REFRESH_BETA")
+    cache_invalidation_channel: str = Field(default="cache:invalidate", env="CACHE_INVALIDATION_CHANNEL")
+    # префикс ключей в Redis: бинарный формат записей несовместим с воркерами,
+    # которые читают голый JSON, поэтому при смене формата меняется и он
+    cache_namespace: str = Field(default="v2", env="CACHE_NAMESPACE")
+    cache_format: str = Field(default="json", env="CACHE_FORMAT")
+    cache_compression: str = Field(default="none", env="CACHE_COMPRESSION")
+    cache_compression_min_size: int = Field(default=1024, env="CACHE_COMPRESSION_MIN_SIZE")
+
+    compression_min_size: int = Field(default=1024, env="COMPRESSION_MIN_SIZE")
+    compression_encodings: list[str] = Field(default=["zstd", "br", "gzip"], env="COMPRESSION_ENCODINGS")
+    cache_precompress: bool = Field(default=True, env="CACHE_PRECOMPRESS")
+
+    warmup_enabled: bool = Field(default=True, env="WARMUP_ENABLED")
+    warmup_timeout: float = Field(default=15.0, env="WARMUP_TIMEOUT")
+    # соединений с БД на движок при старте; воркеров по числу CPU, и каждый
+    # открывает их одновременно с остальными — держать минимальным
+    warmup_db_connections: int = Field(default=1, env="WARMUP_DB_CONNECTIONS")
+    warmup_redis_connections: int = Field(default=10, env="WARMUP_REDIS_CONNECTIONS")
+    # ключи вида "post:<uuid>", которые нужно загрузить в кэш до старта
+    cache_prefill_keys: list[str] = Field(default=[], env="CACHE_PREFILL_KEYS")
+
+    health_cache_ttl: float = Field(default=1.0, env="HEALTH_CACHE_TTL")
+    health_probe_timeout: float = Field(default=0.5, env="HEALTH_PROBE_TIMEOUT")
+    health_max_pool_utilization: float = Field(default=0.95, env="HEALTH_MAX_POOL_UTILIZATION")
+    health_max_loop_lag: float = Field(default=0.25, env="HEALTH_MAX_LOOP_LAG")
+
+    metrics_pool_interval: float = Field(default=5.0, env="METRICS_POOL_INTERVAL")
+    metrics_local_cache_interval: float = Field(default=5.0, env="METRICS_LOCAL_CACHE_INTERVAL")
+
+    # off | log | fail
+    query_budget_mode: str = Field(default="log", env="QUERY_BUDGET_MODE")
+    query_budget: int = Field(default=20, env="QUERY_BUDGET")
+    # шаблон маршрута -> бюджет, например {"/api/v1/users/{user_id}": 5}
+    query_budget_overrides: dict[str, int] = Field(
+        default={
+            # insertmanyvalues режет пачку до 100k строк на INSERT по 1000
+            "/api/v1/posts_orders/bulk": 200,
+            "/api/v1/posts_orders/orders/bulk": 200,
+            "/api/v1/users_profiles/bulk": 200,
+        },
+        env="QUERY_BUDGET_OVERRIDES",
+    )
+    query_repeat_threshold: int = Field(default=3, env="QUERY_REPEAT_THRESHOLD")
+
+    # selectin | joined | aggregate, по умолчанию и для отдельных методов
+    load_strategy: str = Field(default="selectin", env="LOAD_STRATEGY")
+    # например {"RoleRepository.get_by_id": "aggregate"}
+    load_strategies: dict[str, str] = Field(default={}, env="LOAD_STRATEGIES")
+
+    admin_token: str | None = Field(default=None, env="ADMIN_TOKEN")
+    profiler_interval: float = Field(default=0.005, env="PROFILER_INTERVAL")
+    profiler_max_duration: float = Field(default=60.0, env="PROFILER_MAX_DURATION")
+    profiler_signal_duration: float = Field(default=10.0, env="PROFILER_SIGNAL_DURATION")
+    profiler_output_dir: str = Field(default="/tmp/profiles", env="PROFILER_OUTPUT_DIR")
+
+    bulk_copy_threshold: int = Field(default=10_000, env="BULK_COPY_THRESHOLD")
+    export_batch_size: int = Field(default=1_000, env="EXPORT_BATCH_SIZE")
+
     class Config:
         env_file = ".env"
\ No newline at end of file
@@ -7,7 +7,7 @@ redis = Redis(
     host=settings.redis_host,
     port=settings.redis_port,
     db=settings.redis_db,
-    decode_responses=True,
+    decode_responses=False,
 )
 
 CACHE_TTL = settings.cache_ttl
\ No newline at end of file
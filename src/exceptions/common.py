@@ -8,6 +8,13 @@ class NotFoundError(ServiceError):
         super().__init__(f"{entity} not found")
 
 
+class ConflictError(ServiceError):
+    def __init__(self, entity: str, key: str):
+        self.entity = entity
+        self.key = key
+        super().__init__(f"{entity} {key} already exists")
+
+
 class ValidationError(Exception):
     def __init__(self, entity: str):
         self.entity = entity
@@ -1,6 +1,6 @@
 from fastapi.responses import UJSONResponse
 from starlette import status
-from src.exceptions.common import NotFoundError, ValidationError
+from exceptions.common import ConflictError, NotFoundError, ValidationError
 
 
 def register_exception_handlers(app):
@@ -14,6 +14,17 @@ def register_exception_handlers(app):
         )
 
 
+    @app.exception_handler(ConflictError)
+    async def conflict_handler(request, exc: ConflictError):
+        return UJSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={
+                "detail": f"{exc.entity} {exc.key} already exists",
+                "key": exc.key,
+            },
+        )
+
+
     @app.exception_handler(ValidationError)
     async def validation_handler(request, exc: ValidationError):
         return UJSONResponse(
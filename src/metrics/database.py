@@ -0,0 +1,119 @@
+import inspect
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from metrics.metrics import DB_QUERY_DURATION
+
+current_operation: ContextVar[str] = ContextVar("current_operation", default="other")
+
+
+@dataclass
+class QueryStats:
+    """Запросы к БД в рамках одного HTTP-запроса."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float, batch: bool = False) -> None:
+        self.count += 1
+        self.duration += elapsed
+        # пачки одного executemany / insertmanyvalues — не N+1
+        if not batch:
+            self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+request_queries: ContextVar[QueryStats | None] = ContextVar("request_queries", default=None)
+
+
+def record_query(
+    statement: str,
+    elapsed: float,
+    operation: str | None = None,
+    batch: bool = False,
+) -> None:
+    DB_QUERY_DURATION.labels(operation or current_operation.get()).observe(elapsed)
+
+    stats = request_queries.get()
+    if stats is not None:
+        stats.record(statement, elapsed, batch)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(
+            statement,
+            time.perf_counter() - conn.info["query_started"].pop(),
+            batch=executemany,
+        )
+
+    @event.listens_for(sync_engine, "commit")
+    def commit(conn):
+        # COMMIT драйвер шлёт мимо курсора: в бюджет идёт без времени
+        stats = request_queries.get()
+        if stats is not None:
+            stats.count += 1
+
+
+def _wrap_coroutine(operation: str, method):
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = current_operation.set(operation)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+
+    return wrapper
+
+
+def _wrap_async_generator(operation: str, method):
+    @wraps(method)
+    async def wrapper(*args, **kwargs):
+        generator = method(*args, **kwargs)
+        while True:
+            token = current_operation.set(operation)
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                current_operation.reset(token)
+            yield item
+
+    return wrapper
+
+
+def instrument_repository(cls):
+    """Помечает запросы публичных методов репозитория как «Класс.метод»."""
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+
+        operation = f"{cls.__name__}.{name}"
+        if inspect.iscoroutinefunction(method):
+            setattr(cls, name, _wrap_coroutine(operation, method))
+        elif inspect.isasyncgenfunction(method):
+            setattr(cls, name, _wrap_async_generator(operation, method))
+
+    return cls
@@ -0,0 +1,15 @@
+import asyncio
+from dataclasses import asdict
+
+from cache.cache import cache
+from metrics.metrics import LOCAL_CACHE_ENTRIES, LOCAL_CACHE_EVENTS
+
+
+async def collect_local_cache_metrics(interval: float = 5.0) -> None:
+    """Переносит статистику локального LRU воркера в метрики."""
+    while True:
+        for event, value in asdict(cache.local.stats).items():
+            LOCAL_CACHE_EVENTS.labels(event).set(value)
+        LOCAL_CACHE_ENTRIES.set(len(cache.local))
+
+        await asyncio.sleep(interval)
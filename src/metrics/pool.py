@@ -0,0 +1,39 @@
+import asyncio
+
+from metrics.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUTS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT,
+)
+from src.session import engine, pool_status, replica_engine
+
+COUNTERS = (
+    ("checkouts", DB_POOL_CHECKOUTS),
+    ("timeouts", DB_POOL_TIMEOUTS),
+    ("wait_time_total", DB_POOL_WAIT),
+)
+
+
+async def collect_pool_metrics(interval: float = 5.0) -> None:
+    """Переносит состояние пулов в метрики; счётчики растут на прирост с прошлого раза."""
+    engines = {"primary": engine, "replica": replica_engine}
+    last = {role: dict.fromkeys((name for name, _ in COUNTERS), 0) for role in engines}
+
+    while True:
+        for role, role_engine in engines.items():
+            if role_engine is None:
+                continue
+
+            status = pool_status(role_engine)
+            DB_POOL_CHECKED_OUT.labels(role).set(status.get("checked_out", 0))
+            DB_POOL_SIZE.labels(role).set(status.get("size", 0))
+            DB_POOL_OVERFLOW.labels(role).set(status.get("overflow", 0))
+
+            for name, counter in COUNTERS:
+                counter.labels(role).inc(status[name] - last[role][name])
+                last[role][name] = status[name]
+
+        await asyncio.sleep(interval)
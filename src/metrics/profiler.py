@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# в каждый момент в воркере работает не больше одного профайлера
+_busy = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+class SamplingProfiler:
+    """
+    Сэмплирующий профайлер: отдельный поток раз в interval снимает стек
+    потока event loop через sys._current_frames() и копит их в формате
+    collapsed stacks (flamegraph.pl, speedscope).
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+
+        self._names: dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        if not _busy.acquire(blocking=False):
+            raise ProfilerBusy
+        self._thread.start()
+
+    def stop(self) -> str:
+        self._stop.set()
+        self._thread.join()
+        _busy.release()
+
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+
+    def _collapse(self, frame) -> str:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            name = self._names.get(code)
+            if name is None:
+                name = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                self._names[code] = name
+            names.append(name)
+            frame = frame.f_back
+
+        return ";".join(reversed(names))
+
+
+async def profile(duration: float, interval: float) -> str:
+    """Профилирует event loop текущего воркера в течение duration секунд."""
+    profiler = SamplingProfiler(threading.get_ident(), interval)
+    profiler.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        stacks = profiler.stop()
+
+    return stacks
+
+
+def write_profile(output_dir: str, stacks: str, label: str) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{os.getpid()}-{int(time.time() * 1000)}-{label}.collapsed")
+    with open(path, "w") as file:
+        file.write(stacks)
+
+    return path
+
+
+async def profile_to_file(output_dir: str, duration: float, interval: float) -> None:
+    """Профиль по сигналу: результат пишется в файл, ответить некому."""
+    try:
+        stacks = await profile(duration, interval)
+    except ProfilerBusy:
+        logger.warning("Profiler is already running, signal ignored")
+        return
+
+    logger.warning("Profile written to %s", write_profile(output_dir, stacks, "signal"))
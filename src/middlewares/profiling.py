@@ -0,0 +1,57 @@
+import secrets
+import threading
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics.profiler import ProfilerBusy, SamplingProfiler, write_profile
+
+
+class ProfilingMiddleware:
+    """
+    Профилирование отдельного запроса по заголовку X-Profile с админским
+    токеном. Стеки пишутся в файл, путь возвращается в X-Profile-File.
+    Сэмплируется весь event loop, так что параллельные запросы воркера
+    тоже попадут в профиль.
+    """
+
+    def __init__(self, app: ASGIApp, token: str, output_dir: str, interval: float):
+        self.app = app
+        self.token = token
+        self.output_dir = output_dir
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(threading.get_ident(), self.interval)
+        try:
+            profiler.start()
+        except ProfilerBusy:
+            await self.app(scope, receive, send)
+            return
+
+        stopped = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal stopped
+            if message["type"] == "http.response.start":
+                stopped = True
+                path = write_profile(self.output_dir, profiler.stop(), "request")
+                MutableHeaders(scope=message).append("X-Profile-File", path)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not stopped:
+                profiler.stop()
+
+    def _requested(self, scope: Scope) -> bool:
+        headers = Headers(scope=scope)
+        if "x-profile" not in headers:
+            return False
+
+        return secrets.compare_digest(headers.get("x-admin-token", ""), self.token)
@@ -0,0 +1,93 @@
+import logging
+import time
+
+from fastapi.responses import UJSONResponse
+from starlette import status
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from metrics.database import QueryStats, request_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetMiddleware:
+    """
+    Считает SQL-запросы и время в БД на каждый HTTP-запрос, отдаёт их
+    в Server-Timing и ругается на превышение бюджета маршрута и на
+    повторяющиеся одинаковые запросы (признак N+1).
+    В режиме fail ответ чтения над бюджетом заменяется на 500; запись к
+    этому моменту уже закоммичена, поэтому для неё только пишем в лог.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        budget: int,
+        mode: str = "log",
+        overrides: dict[str, int] | None = None,
+        repeat_threshold: int = 3,
+    ):
+        self.app = app
+        self.budget = budget
+        self.mode = mode
+        self.overrides = overrides or {}
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = request_queries.set(stats)
+        started = time.perf_counter()
+        rejected = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal rejected
+            if message["type"] == "http.response.start":
+                if not self._check(scope, stats):
+                    rejected = True
+                    response = UJSONResponse(
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        content={"detail": "Query budget exceeded"},
+                    )
+                    await response(scope, receive, send)
+                    return
+
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                    f"total;dur={(time.perf_counter() - started) * 1000:.2f}",
+                )
+            elif rejected:
+                return
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_queries.reset(token)
+
+    def _check(self, scope: Scope, stats: QueryStats) -> bool:
+        route = getattr(scope.get("route"), "path", scope["path"])
+        budget = self.overrides.get(route, self.budget)
+
+        for statement, count in stats.repeated(self.repeat_threshold):
+            logger.warning(
+                "Possible N+1 on %s %s: statement executed %d times: %.200s",
+                scope["method"], route, count, statement,
+            )
+
+        if stats.count <= budget:
+            return True
+
+        logger.warning(
+            "Query budget exceeded on %s %s: %d queries (budget %d), %.1f ms in DB",
+            scope["method"], route, stats.count, budget, stats.duration * 1000,
+        )
+        committed = scope.get("state", {}).get("db_write", False)
+        return self.mode != "fail" or committed
@@ -20,15 +20,18 @@ class CommentModel(Base):
     )
 
     role_o2o: Mapped["RoleModel"] = relationship(
-        back_populates="main_comment"
+        back_populates="main_comment",
+        foreign_keys=[role_o2o_id],
     )
 
     role_o2m_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey("roles.id", ondelete="CASCADE")
+        ForeignKey("roles.id", ondelete="CASCADE"),
+        index=True,
     )
 
     role_o2m: Mapped["RoleModel"] = relationship(
-        back_populates="comments"
+        back_populates="comments",
+        foreign_keys=[role_o2m_id],
     )
 
     roles: Mapped[list["RoleModel"]] = relationship(
@@ -19,14 +19,17 @@ class OrderModel(Base):
         unique=True
     )
     post: Mapped["PostModel"] = relationship(
-        back_populates="order"
+        back_populates="order",
+        foreign_keys=[post_id],
     )
 
     post_o2m_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey("posts.id")
+        ForeignKey("posts.id"),
+        index=True
     )
     post_o2m: Mapped["PostModel"] = relationship(
-        back_populates="orders"
+        back_populates="orders",
+        foreign_keys=[post_o2m_id],
     )
 
     posts_m2m: Mapped[list["PostModel"]] = relationship(
@@ -17,7 +17,8 @@ class PostOrderM2M(Base):
     )
     order_id: Mapped[UUID] = mapped_column(
         ForeignKey("orders.id"),
-        primary_key=True
+        primary_key=True,
+        index=True
     )
 
 
@@ -30,12 +31,14 @@ class PostModel(Base):
 
     order: Mapped["OrderModel"] = relationship(
         back_populates="post",
+        foreign_keys="OrderModel.post_id",
         uselist=False,
         cascade="all, delete-orphan"
     )
 
     orders: Mapped[list["OrderModel"]] = relationship(
         back_populates="post_o2m",
+        foreign_keys="OrderModel.post_o2m_id",
         cascade="all, delete-orphan"
     )
 
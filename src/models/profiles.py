@@ -17,10 +17,16 @@ class ProfileModel(Base):
 
     owner_id: Mapped[UUID] = mapped_column(
         ForeignKey("users.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     owner: Mapped["UserModel"] = relationship(
         back_populates="profiles"
     )
 
+    many_users: Mapped[list["UserModel"]] = relationship(
+        secondary="user_profile",
+        back_populates="many_profiles"
+    )
+
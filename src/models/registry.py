@@ -0,0 +1,5 @@
+# импорт всех модулей моделей: после него Base.metadata и мапперы полные,
+# связи по строковым именам разрешаются. Новую модель добавлять сюда
+from models import comments, orders, posts, profiles, roles, users
+
+__all__ = ["comments", "orders", "posts", "profiles", "roles", "users"]
@@ -20,6 +20,7 @@ roles_comments_m2m = sa.Table(
         "comment_id",
         sa.ForeignKey("comments.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -32,6 +33,7 @@ class RoleModel(Base):
 
     main_comment: Mapped["CommentModel"] = relationship(
         back_populates="role_o2o",
+        foreign_keys="CommentModel.role_o2o_id",
         uselist=False,
         cascade="all, delete-orphan",
         single_parent=True,
@@ -39,6 +41,7 @@ class RoleModel(Base):
 
     comments: Mapped[list["CommentModel"]] = relationship(
         back_populates="role_o2m",
+        foreign_keys="CommentModel.role_o2m_id",
         cascade="all, delete-orphan",
     )
 
@@ -13,7 +13,7 @@ user_profile = sa.Table(
     "user_profile",
     Base.metadata,
     sa.Column("user_id", sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
-    sa.Column("profile_id", sa.ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True),
+    sa.Column("profile_id", sa.ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True, index=True),
 )
 
 
@@ -23,10 +23,11 @@ class UserModel(Base):
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column()
 
+    # тот же owner_id, что и у profiles: отдельной обратной связи нет
     profile: Mapped["ProfileModel"] = relationship(
-        back_populates="user",
         uselist=False,
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        overlaps="profiles,owner",
     )
 
     profiles: Mapped[list["ProfileModel"]] = relationship(
@@ -0,0 +1,92 @@
+import re
+from typing import Any
+
+from asyncpg import UniqueViolationError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from exceptions.common import ConflictError
+from models.base import Base
+
+UNIQUE_VIOLATION = "23505"
+
+# DETAIL у unique_violation: Key (id)=(...) already exists.
+_DUPLICATE_KEY = re.compile(r"Key \(.+?\)=\((?P<values>.*)\) already exists")
+
+
+def _conflict(model: type[Base], error: Any) -> ConflictError:
+    match = _DUPLICATE_KEY.search(getattr(error, "detail", None) or "")
+    key = match["values"] if match else "key"
+    return ConflictError(model.__name__.removesuffix("Model"), key)
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    on_conflict: str = "error",
+) -> int:
+    """
+    INSERT ... VALUES пачками (insertmanyvalues) с опциональным ON CONFLICT.
+    Возвращает число вставленных или обновлённых строк.
+    """
+    table = model.__table__
+    target = model.on_conflict_constraint() or tuple(
+        column.name for column in table.primary_key
+    )
+
+    # обновляем только присланные колонки: остальные в excluded были бы
+    # NULL/default и затёрли бы существующие значения
+    provided = set().union(*rows)
+    update_columns = [
+        column.name
+        for column in table.columns
+        if column.name in provided and column.name not in target
+    ]
+
+    stmt = insert(table)
+    if on_conflict == "ignore" or (on_conflict == "update" and not update_columns):
+        stmt = stmt.on_conflict_do_nothing(index_elements=target)
+    elif on_conflict == "update":
+        stmt = stmt.on_conflict_do_update(
+            index_elements=target,
+            set_={name: stmt.excluded[name] for name in update_columns},
+        )
+
+    try:
+        result = await session.execute(stmt.returning(*table.primary_key), rows)
+    except IntegrityError as error:
+        # с on_conflict="error" повтор ключа — ошибка клиента, а не 500
+        if getattr(error.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+            raise
+        raise _conflict(model, error.orig) from error
+
+    return len(result.all())
+
+
+async def copy_rows(
+    session: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+) -> int:
+    """
+    COPY через драйвер asyncpg на соединении текущей сессии.
+    ON CONFLICT не поддерживается, строки должны содержать все колонки.
+    """
+    table = model.__table__
+    columns = [column.name for column in table.columns]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+
+    try:
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(row.get(column) for column in columns) for row in rows],
+            columns=columns,
+        )
+    except UniqueViolationError as error:
+        raise _conflict(model, error) from error
+
+    return len(rows)
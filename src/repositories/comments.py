@@ -1,12 +1,39 @@
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from metrics.database import instrument_repository
 from models.comments import CommentModel
+from models.roles import RoleModel
+from repositories.filters import id_any
+from repositories.loading import load_one, load_strategy
+from repositories.pagination import KeysetQuery, keyset_page
+from repositories.projections import labelled, unflatten
 
 
+# поля CommentRead: role подтягивается тем же запросом через LEFT JOIN
+READ_SELECT = (
+    select(
+        CommentModel.id,
+        CommentModel.content,
+        CommentModel.is_edited,
+        *labelled("role", (RoleModel.id, RoleModel.name)),
+    )
+    .outerjoin(CommentModel.role_o2o)
+)
+READ_BY_ID = READ_SELECT.where(CommentModel.id == bindparam("id"))
+READ_MANY = READ_SELECT.where(id_any(CommentModel.id))
+READ_PAGE = KeysetQuery(READ_SELECT, CommentModel.id)
+DELETE_BY_ID = (
+    delete(CommentModel)
+    .where(CommentModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+
+@instrument_repository
 class CommentRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -18,15 +45,40 @@ class CommentRepository:
             self,
             comment_id: UUID,
     ) -> CommentModel | None:
-        stmt = (
-            select(CommentModel)
-            .where(CommentModel.id == comment_id)
-            .options(selectinload(CommentModel.role_o2o))
+        return await load_one(
+            self.session,
+            CommentModel,
+            comment_id,
+            (
+                CommentModel.role_o2o,
+            ),
+            load_strategy("CommentRepository.get_by_id"),
         )
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def read_by_id(
+            self,
+            comment_id: UUID,
+    ) -> dict[str, Any] | None:
+        row = (await self.session.execute(READ_BY_ID, {"id": comment_id})).first()
+        return None if row is None else unflatten(row)
+
+    async def read_many(
+            self,
+            comment_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:
+        result = await self.session.execute(READ_MANY, {"ids": list(comment_ids)})
+        return [unflatten(row) for row in result]
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        rows, next_cursor = keyset_page(result.all(), limit)
+        return [unflatten(row) for row in rows], next_cursor
 
     async def delete_by_id(self, comment_id: UUID) -> None:
-        stmt = delete(CommentModel).where(CommentModel.id == comment_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+        await self.session.execute(DELETE_BY_ID, {"id": comment_id})
\ No newline at end of file
@@ -0,0 +1,111 @@
+import time
+from typing import Any, Sequence
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from config.config import Settings
+from metrics.database import record_query
+
+settings = Settings()
+
+# пулы asyncpg по URL движка, к которому привязана сессия: так сохраняется
+# выбор primary/реплики и read-your-writes из get_read_session
+pools: dict[str, asyncpg.Pool] = {}
+
+
+async def open_pools(engines: Sequence[AsyncEngine]) -> None:
+    """
+    Пулы живут рядом с пулами SQLAlchemy: на каждую базу воркер держит до
+    fast_path_pool_size соединений сверх db_pool_size + db_max_overflow,
+    из них fast_path_pool_min_size открыты постоянно. Это нужно учитывать
+    в max_connections сервера (или в лимитах пулера).
+    """
+    for engine in engines:
+        # параметры SQLAlchemy в query строке asyncpg принял бы за server_settings
+        dsn = engine.url.set(drivername="postgresql", query={})
+        pools[str(engine.url)] = await asyncpg.create_pool(
+            dsn.render_as_string(hide_password=False),
+            min_size=settings.fast_path_pool_min_size,
+            max_size=settings.fast_path_pool_size,
+            # за pgbouncer в transaction mode подготовленные выражения не живут
+            statement_cache_size=0 if settings.db_external_pooler else settings.db_statement_cache_size,
+            command_timeout=settings.db_command_timeout,
+            server_settings=settings.db_server_settings,
+        )
+
+
+async def close_pools() -> None:
+    for pool in pools.values():
+        await pool.close()
+    pools.clear()
+
+
+class FastReadRepository:
+    """
+    Чтение по первичному ключу напрямую через asyncpg, минуя ORM и
+    AsyncSession. Выражения готовятся драйвером один раз на соединение.
+    Повторяет read_by_id / read_many ORM-репозитория и отдаёт словари
+    для схемы *Read.
+    """
+
+    BY_ID: str
+    MANY: str
+
+    def __init__(self, pool: asyncpg.Pool):
+        self.pool = pool
+
+    async def read_by_id(self, entity_id: UUID) -> dict[str, Any] | None:
+        started = time.perf_counter()
+        try:
+            async with self.pool.acquire() as connection:
+                record = await connection.fetchrow(self.BY_ID, entity_id)
+        finally:
+            self._record("read_by_id", self.BY_ID, started)
+
+        return None if record is None else dict(record)
+
+    async def read_many(self, entity_ids: Sequence[UUID]) -> list[dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            async with self.pool.acquire() as connection:
+                records = await connection.fetch(self.MANY, list(entity_ids))
+        finally:
+            self._record("read_many", self.MANY, started)
+
+        return [dict(record) for record in records]
+
+    def _record(self, method: str, query: str, started: float) -> None:
+        # мимо SQLAlchemy события курсора не срабатывают, учитываем сами
+        record_query(query, time.perf_counter() - started, f"{type(self).__name__}.{method}")
+
+
+class PostFastRepository(FastReadRepository):
+    BY_ID = "SELECT id, title, content FROM posts WHERE id = $1"
+    MANY = "SELECT id, title, content FROM posts WHERE id = ANY($1::uuid[])"
+
+
+class UserFastRepository(FastReadRepository):
+    BY_ID = "SELECT id, name FROM users WHERE id = $1"
+    MANY = "SELECT id, name FROM users WHERE id = ANY($1::uuid[])"
+
+
+FAST_REPOSITORIES: dict[str, type[FastReadRepository]] = {
+    "PostRepository": PostFastRepository,
+    "UserRepository": UserFastRepository,
+}
+
+
+def read_repository(repository_class: type, session: AsyncSession):
+    """
+    Репозиторий для чтения: asyncpg-версия, если она включена в
+    FAST_PATH_REPOSITORIES и пул для базы сессии открыт, иначе ORM.
+    """
+    name = repository_class.__name__
+    if name in settings.fast_path_repositories and name in FAST_REPOSITORIES:
+        pool = pools.get(str(session.bind.url))
+        if pool is not None:
+            return FAST_REPOSITORIES[name](pool)
+
+    return repository_class(session)
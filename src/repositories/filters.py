@@ -0,0 +1,10 @@
+from sqlalchemy import ColumnElement, Uuid, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def id_any(column: InstrumentedAttribute) -> ColumnElement[bool]:
+    # один параметр-массив вместо IN (...): текст запроса не зависит
+    # от числа id, и подготовленный statement переиспользуется.
+    # Значение передаётся при выполнении: {"ids": [...]}
+    return column == any_(bindparam("ids", type_=ARRAY(Uuid)))
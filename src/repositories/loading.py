@@ -0,0 +1,141 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import JSON, Select, bindparam, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper, QueryableAttribute, joinedload, make_transient_to_detached, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from config.config import Settings
+
+settings = Settings()
+
+ModelT = TypeVar("ModelT")
+
+STRATEGIES = ("selectin", "joined", "aggregate")
+
+_statements: dict[tuple[type, tuple[str, ...], str], Select] = {}
+
+# json_agg отдаёт всё, кроме чисел и bool, строками
+CONVERTERS = {
+    UUID: UUID,
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+def load_strategy(operation: str) -> str:
+    """Стратегия загрузки связей для метода вида «UserRepository.get_by_id»."""
+    strategy = settings.load_strategies.get(operation, settings.load_strategy)
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown load strategy {strategy!r} for {operation}")
+
+    return strategy
+
+
+async def load_one(
+    session: AsyncSession,
+    model: type[ModelT],
+    id_: UUID,
+    relationships: tuple[QueryableAttribute, ...],
+    strategy: str,
+) -> ModelT | None:
+    """
+    Загружает сущность по id со связями:
+    selectin — отдельный SELECT на каждую связь,
+    joined — один запрос с LEFT JOIN, строки множатся на размеры коллекций,
+    aggregate — один запрос, дети собираются в json_agg коррелированными
+    подзапросами и гидрируются без обращений к БД.
+    """
+    stmt = _statement(model, relationships, strategy)
+    result = await session.execute(stmt, {"id": id_})
+
+    if strategy != "aggregate":
+        return result.unique().scalar_one_or_none()
+
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    instance, *aggregates = row
+    for attribute, rows in zip(relationships, aggregates):
+        prop = attribute.property
+        children = [await _hydrate(session, prop.mapper, data) for data in rows]
+
+        if prop.uselist:
+            set_committed_value(instance, prop.key, children)
+        else:
+            set_committed_value(instance, prop.key, children[0] if children else None)
+
+    return instance
+
+
+def _statement(model: type, relationships: tuple[QueryableAttribute, ...], strategy: str) -> Select:
+    # строится один раз на комбинацию, дальше меняется только параметр id;
+    # ключ по именам: атрибуты переопределяют == под SQL-выражения
+    key = (model, tuple(relationship.key for relationship in relationships), strategy)
+    stmt = _statements.get(key)
+    if stmt is not None:
+        return stmt
+
+    criterion = model.id == bindparam("id")
+    if strategy == "aggregate":
+        stmt = select(model, *map(_aggregate_column, relationships)).where(criterion)
+    else:
+        loader = joinedload if strategy == "joined" else selectinload
+        stmt = (
+            select(model)
+            .where(criterion)
+            .options(*(loader(relationship) for relationship in relationships))
+        )
+
+    _statements[key] = stmt
+    return stmt
+
+
+def _aggregate_column(attribute: QueryableAttribute):
+    prop = attribute.property
+    target = prop.entity.local_table
+
+    stmt = select(
+        func.coalesce(
+            func.json_agg(target.table_valued()),
+            literal_column("'[]'::json"),
+            type_=JSON,
+        ),
+    ).where(prop.primaryjoin)
+    if prop.secondary is not None:
+        stmt = stmt.where(prop.secondaryjoin)
+
+    return stmt.scalar_subquery().label(prop.key)
+
+
+async def _hydrate(session: AsyncSession, mapper: Mapper, data: dict[str, Any]) -> Any:
+    child = mapper.class_manager.new_instance()
+    for key, name, convert in _columns(mapper):
+        value = data.get(name)
+        set_committed_value(child, key, convert(value) if convert and value is not None else value)
+
+    # объект уже «из базы»: merge без load не ходит в БД и вернёт
+    # экземпляр из identity map, если он там уже есть
+    make_transient_to_detached(child)
+    return await session.merge(child, load=False)
+
+
+@lru_cache(maxsize=None)
+def _columns(mapper: Mapper) -> tuple[tuple[str, str, Any], ...]:
+    columns = []
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = None
+        columns.append((prop.key, column.name, CONVERTERS.get(python_type)))
+
+    return tuple(columns)
@@ -1,12 +1,39 @@
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from metrics.database import instrument_repository
 from models.orders import OrderModel
+from models.posts import PostModel
+from repositories.bulk import bulk_insert, copy_rows
+from repositories.filters import id_any
+from repositories.loading import load_one, load_strategy
+from repositories.pagination import KeysetQuery, keyset_page
+from repositories.projections import labelled, unflatten
 
 
+# поля OrderRead: post подтягивается тем же запросом через LEFT JOIN
+READ_SELECT = (
+    select(
+        OrderModel.id,
+        OrderModel.price,
+        *labelled("post", (PostModel.id, PostModel.title, PostModel.content)),
+    )
+    .outerjoin(OrderModel.post)
+)
+READ_BY_ID = READ_SELECT.where(OrderModel.id == bindparam("id"))
+READ_MANY = READ_SELECT.where(id_any(OrderModel.id))
+READ_PAGE = KeysetQuery(READ_SELECT, OrderModel.id)
+DELETE_BY_ID = (
+    delete(OrderModel)
+    .where(OrderModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+
+@instrument_repository
 class OrderRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -14,22 +41,55 @@ class OrderRepository:
     async def create(self, order: OrderModel) -> None:
         self.session.add(order)
 
+    async def bulk_create(
+            self,
+            rows: list[dict[str, Any]],
+            on_conflict: str = "error",
+    ) -> int:
+        return await bulk_insert(self.session, OrderModel, rows, on_conflict)
+
+    async def copy_rows(self, rows: list[dict[str, Any]]) -> int:
+        return await copy_rows(self.session, OrderModel, rows)
+
     async def get_by_id(
             self,
             order_id: UUID,
     ) -> OrderModel | None:
-        stmt = (
-            select(OrderModel)
-            .where(OrderModel.id == order_id)
-            .options(
-                selectinload(OrderModel.post),
-                selectinload(OrderModel.posts_m2m),
-            )
+        return await load_one(
+            self.session,
+            OrderModel,
+            order_id,
+            (
+                OrderModel.post,
+                OrderModel.posts_m2m,
+            ),
+            load_strategy("OrderRepository.get_by_id"),
         )
 
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+    async def read_by_id(
+            self,
+            order_id: UUID,
+    ) -> dict[str, Any] | None:
+        row = (await self.session.execute(READ_BY_ID, {"id": order_id})).first()
+        return None if row is None else unflatten(row)
+
+    async def read_many(
+            self,
+            order_ids: Sequence[UUID],
+    ) -> list[dict[str, Any]]:
+        result = await self.session.execute(READ_MANY, {"ids": list(order_ids)})
+        return [unflatten(row) for row in result]
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        rows, next_cursor = keyset_page(result.all(), limit)
+        return [unflatten(row) for row in rows], next_cursor
 
     async def delete_by_id(self, order_id: UUID) -> None:
-        stmt = delete(OrderModel).where(OrderModel.id == order_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+        await self.session.execute(DELETE_BY_ID, {"id": order_id})
\ No newline at end of file
@@ -0,0 +1,54 @@
+import base64
+import binascii
+from typing import Any, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, bindparam
+from sqlalchemy.orm import InstrumentedAttribute
+
+from exceptions.common import ValidationError
+
+T = TypeVar("T")
+
+
+def encode_cursor(last_id: UUID) -> str:
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> UUID:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return UUID(bytes=raw)
+    except (binascii.Error, ValueError):
+        raise ValidationError("Cursor")
+
+
+class KeysetQuery:
+    """
+    Keyset-пагинация по первичному ключу: вместо OFFSET продолжаем
+    с последнего id, поэтому стоимость страницы не зависит от глубины.
+    Лишняя строка в LIMIT показывает, есть ли следующая страница.
+    Оба варианта запроса строятся один раз, курсор и лимит — параметры.
+    """
+
+    def __init__(self, stmt: Select, id_column: InstrumentedAttribute):
+        self.first = stmt.order_by(id_column).limit(bindparam("limit"))
+        self.following = (
+            stmt.where(id_column > bindparam("after"))
+            .order_by(id_column)
+            .limit(bindparam("limit"))
+        )
+
+    def bind(self, cursor: str | None, limit: int) -> tuple[Select, dict[str, Any]]:
+        if cursor is None:
+            return self.first, {"limit": limit + 1}
+
+        return self.following, {"limit": limit + 1, "after": decode_cursor(cursor)}
+
+
+def keyset_page(items: Sequence[T], limit: int) -> tuple[list[T], str | None]:
+    if len(items) <= limit:
+        return list(items), None
+
+    page = list(items[:limit])
+    return page, encode_cursor(page[-1].id)
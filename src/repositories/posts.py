@@ -1,12 +1,31 @@
+from typing import Any, AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from metrics.database import instrument_repository
 from models.posts import PostModel
+from repositories.bulk import bulk_insert, copy_rows
+from repositories.filters import id_any
+from repositories.loading import load_one, load_strategy
+from repositories.pagination import KeysetQuery, keyset_page
+from repositories.streaming import stream_partitions
 
 
+# поля PostRead: чтение идёт строками, без ORM-объектов и identity map
+READ_COLUMNS = (PostModel.id, PostModel.title, PostModel.content)
+READ_BY_ID = select(*READ_COLUMNS).where(PostModel.id == bindparam("id"))
+READ_MANY = select(*READ_COLUMNS).where(id_any(PostModel.id))
+READ_PAGE = KeysetQuery(select(*READ_COLUMNS), PostModel.id)
+DELETE_BY_ID = (
+    delete(PostModel)
+    .where(PostModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+
+@instrument_repository
 class PostRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -14,22 +33,63 @@ class PostRepository:
     async def create(self, post: PostModel) -> None:
         self.session.add(post)
 
+    async def bulk_create(
+            self,
+            rows: list[dict[str, Any]],
+            on_conflict: str = "error",
+    ) -> int:
+        return await bulk_insert(self.session, PostModel, rows, on_conflict)
+
+    async def copy_rows(self, rows: list[dict[str, Any]]) -> int:
+        return await copy_rows(self.session, PostModel, rows)
+
     async def get_by_id(
             self,
             post_id: UUID,
     ) -> PostModel | None:
-        stmt = (
-            select(PostModel)
-            .where(PostModel.id == post_id)
-            .options(
-                selectinload(PostModel.orders),
-                selectinload(PostModel.orders_m2m),
-            )
+        return await load_one(
+            self.session,
+            PostModel,
+            post_id,
+            (
+                PostModel.orders,
+                PostModel.orders_m2m,
+            ),
+            load_strategy("PostRepository.get_by_id"),
         )
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def read_by_id(
+            self,
+            post_id: UUID,
+    ) -> Row | None:
+        result = await self.session.execute(READ_BY_ID, {"id": post_id})
+        return result.first()
+
+    async def read_many(
+            self,
+            post_ids: Sequence[UUID],
+    ) -> Sequence[Row]:
+        result = await self.session.execute(READ_MANY, {"ids": list(post_ids)})
+        return result.all()
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        return keyset_page(result.all(), limit)
+
+    async def stream_with_orders(
+            self,
+            batch_size: int,
+    ) -> AsyncIterator[Sequence[PostModel]]:
+        async for partition in stream_partitions(
+            self.session, PostModel, PostModel.orders, batch_size,
+        ):
+            yield partition
 
     async def delete_by_id(self, post_id: UUID) -> None:
-        stmt = delete(PostModel).where(PostModel.id == post_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+        await self.session.execute(DELETE_BY_ID, {"id": post_id})
\ No newline at end of file
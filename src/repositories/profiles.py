@@ -1,11 +1,29 @@
+from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from metrics.database import instrument_repository
 from models.profiles import ProfileModel
+from repositories.filters import id_any
+from repositories.pagination import KeysetQuery, keyset_page
 
 
+# поля ProfileRead: чтение идёт строками, без ORM-объектов и identity map
+READ_COLUMNS = (ProfileModel.id, ProfileModel.full_name, ProfileModel.bio, ProfileModel.owner_id)
+READ_BY_ID = select(*READ_COLUMNS).where(ProfileModel.id == bindparam("id"))
+READ_MANY = select(*READ_COLUMNS).where(id_any(ProfileModel.id))
+READ_PAGE = KeysetQuery(select(*READ_COLUMNS), ProfileModel.id)
+DELETE_BY_ID = (
+    delete(ProfileModel)
+    .where(ProfileModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+GET_BY_ID = select(ProfileModel).where(ProfileModel.id == bindparam("id"))
+
+
+@instrument_repository
 class ProfileRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -17,11 +35,32 @@ class ProfileRepository:
             self,
             profile_id: UUID,
     ) -> ProfileModel | None:
-        stmt = select(ProfileModel).where(ProfileModel.id == profile_id)
-
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(GET_BY_ID, {"id": profile_id})
         return result.scalars().first()
 
+    async def read_by_id(
+            self,
+            profile_id: UUID,
+    ) -> Row | None:
+        result = await self.session.execute(READ_BY_ID, {"id": profile_id})
+        return result.first()
+
+    async def read_many(
+            self,
+            profile_ids: Sequence[UUID],
+    ) -> Sequence[Row]:
+        result = await self.session.execute(READ_MANY, {"ids": list(profile_ids)})
+        return result.all()
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        return keyset_page(result.all(), limit)
+
     async def delete_by_id(self, profile_id: UUID) -> None:
-        stmt = delete(ProfileModel).where(ProfileModel.id == profile_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+        await self.session.execute(DELETE_BY_ID, {"id": profile_id})
\ No newline at end of file
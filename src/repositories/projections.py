@@ -0,0 +1,31 @@
+from typing import Any, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.orm import InstrumentedAttribute
+
+SEPARATOR = "__"
+
+
+def labelled(prefix: str, columns: Sequence[InstrumentedAttribute]) -> tuple:
+    """Колонки связанной таблицы с префиксом, чтобы не столкнуться с основными."""
+    return tuple(column.label(f"{prefix}{SEPARATOR}{column.key}") for column in columns)
+
+
+def unflatten(row: Row) -> dict[str, Any]:
+    """
+    Собирает плоскую строку с префиксными колонками во вложенный словарь
+    для схемы чтения. Связь без строки (LEFT JOIN дал NULL id) -> None.
+    """
+    data: dict[str, Any] = {}
+    for key, value in row._mapping.items():
+        prefix, separator, field = key.partition(SEPARATOR)
+        if separator:
+            data.setdefault(prefix, {})[field] = value
+        else:
+            data[key] = value
+
+    for key, value in data.items():
+        if isinstance(value, dict) and value.get("id") is None:
+            data[key] = None
+
+    return data
@@ -1,13 +1,30 @@
+from typing import AsyncIterator, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from models.orders import OrderModel
+from metrics.database import instrument_repository
 from models.roles import RoleModel
+from repositories.filters import id_any
+from repositories.loading import load_one, load_strategy
+from repositories.pagination import KeysetQuery, keyset_page
+from repositories.streaming import stream_partitions
 
 
+# поля RoleRead: чтение идёт строками, без ORM-объектов и identity map
+READ_COLUMNS = (RoleModel.id, RoleModel.name)
+READ_BY_ID = select(*READ_COLUMNS).where(RoleModel.id == bindparam("id"))
+READ_MANY = select(*READ_COLUMNS).where(id_any(RoleModel.id))
+READ_PAGE = KeysetQuery(select(*READ_COLUMNS), RoleModel.id)
+DELETE_BY_ID = (
+    delete(RoleModel)
+    .where(RoleModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+
+@instrument_repository
 class RoleRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -19,19 +36,50 @@ class RoleRepository:
             self,
             role_id: UUID,
     ) -> RoleModel | None:
-        stmt = (
-            select(RoleModel)
-            .where(RoleModel.id == role_id)
-            .options(
-                selectinload(RoleModel.main_comment),
-                selectinload(RoleModel.comments),
-                selectinload(RoleModel.shared_comments),
-            )
+        return await load_one(
+            self.session,
+            RoleModel,
+            role_id,
+            (
+                RoleModel.main_comment,
+                RoleModel.comments,
+                RoleModel.shared_comments,
+            ),
+            load_strategy("RoleRepository.get_by_id"),
         )
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def read_by_id(
+            self,
+            role_id: UUID,
+    ) -> Row | None:
+        result = await self.session.execute(READ_BY_ID, {"id": role_id})
+        return result.first()
+
+    async def read_many(
+            self,
+            role_ids: Sequence[UUID],
+    ) -> Sequence[Row]:
+        result = await self.session.execute(READ_MANY, {"ids": list(role_ids)})
+        return result.all()
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        return keyset_page(result.all(), limit)
+
+    async def stream_with_comments(
+            self,
+            batch_size: int,
+    ) -> AsyncIterator[Sequence[RoleModel]]:
+        async for partition in stream_partitions(
+            self.session, RoleModel, RoleModel.comments, batch_size,
+        ):
+            yield partition
 
-    async def delete_by_id(self, order_id: UUID) -> None:
-        stmt = delete(OrderModel).where(OrderModel.id == order_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+    async def delete_by_id(self, role_id: UUID) -> None:
+        await self.session.execute(DELETE_BY_ID, {"id": role_id})
\ No newline at end of file
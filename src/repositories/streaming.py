@@ -0,0 +1,36 @@
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
+
+from models.base import Base
+
+
+async def stream_partitions(
+    session: AsyncSession,
+    model: type[Base],
+    relationship: InstrumentedAttribute,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Base]]:
+    """
+    Выгружает все строки model по id пачками по batch_size вместе со
+    связью relationship (selectinload на каждую пачку).
+    """
+    stmt = (
+        select(model)
+        .options(selectinload(relationship))
+        .order_by(model.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    # серверному курсору нужна транзакция, а сессии чтения работают
+    # в autocommit; заодно выгрузка видит один снимок данных
+    await session.connection(
+        execution_options={"isolation_level": "REPEATABLE READ"},
+    )
+    result = await session.stream(stmt)
+    async for partition in result.scalars().partitions():
+        yield partition
+        # выгруженные объекты не должны копиться в identity map
+        session.expunge_all()
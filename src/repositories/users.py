@@ -1,13 +1,31 @@
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import Row, bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from metrics.database import instrument_repository
 from models.orders import OrderModel
 from models.users import UserModel
+from repositories.bulk import bulk_insert, copy_rows
+from repositories.filters import id_any
+from repositories.loading import load_one, load_strategy
+from repositories.pagination import KeysetQuery, keyset_page
 
 
+# поля UserRead: чтение идёт строками, без ORM-объектов и identity map
+READ_COLUMNS = (UserModel.id, UserModel.name)
+READ_BY_ID = select(*READ_COLUMNS).where(UserModel.id == bindparam("id"))
+READ_MANY = select(*READ_COLUMNS).where(id_any(UserModel.id))
+READ_PAGE = KeysetQuery(select(*READ_COLUMNS), UserModel.id)
+DELETE_BY_ID = (
+    delete(UserModel)
+    .where(UserModel.id == bindparam("id"))
+    .execution_options(synchronize_session="fetch")
+)
+
+
+@instrument_repository
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -15,23 +33,55 @@ class UserRepository:
     async def create(self, user: UserModel) -> None:
         self.session.add(user)
 
+    async def bulk_create(
+            self,
+            rows: list[dict[str, Any]],
+            on_conflict: str = "error",
+    ) -> int:
+        return await bulk_insert(self.session, UserModel, rows, on_conflict)
+
+    async def copy_rows(self, rows: list[dict[str, Any]]) -> int:
+        return await copy_rows(self.session, UserModel, rows)
+
     async def get_by_id(
             self,
             user_id: UUID,
     ) -> UserModel | None:
-        stmt = (
-            select(UserModel)
-            .where(UserModel.id == user_id)
-            .options(
-                selectinload(UserModel.profile),
-                selectinload(UserModel.profiles),
-                selectinload(UserModel.many_profiles),
-            )
+        return await load_one(
+            self.session,
+            UserModel,
+            user_id,
+            (
+                UserModel.profile,
+                UserModel.profiles,
+                UserModel.many_profiles,
+            ),
+            load_strategy("UserRepository.get_by_id"),
         )
 
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def read_by_id(
+            self,
+            user_id: UUID,
+    ) -> Row | None:
+        result = await self.session.execute(READ_BY_ID, {"id": user_id})
+        return result.first()
+
+    async def read_many(
+            self,
+            user_ids: Sequence[UUID],
+    ) -> Sequence[Row]:
+        result = await self.session.execute(READ_MANY, {"ids": list(user_ids)})
+        return result.all()
+
+    async def read_page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+    ) -> tuple[list[Row], str | None]:
+        stmt, params = READ_PAGE.bind(cursor, limit)
+
+        result = await self.session.execute(stmt, params)
+        return keyset_page(result.all(), limit)
 
     async def delete_by_id(self, user_id: UUID) -> None:
-        stmt = delete(UserModel).where(UserModel.id == user_id)
-        await self.session.execute(stmt)
\ No newline at end of file
+        await self.session.execute(DELETE_BY_ID, {"id": user_id})
\ No newline at end of file
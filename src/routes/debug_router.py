@@ -0,0 +1,32 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from config.config import Settings
+from metrics.profiler import ProfilerBusy, profile
+
+settings = Settings()
+
+router = APIRouter(prefix='/debug', include_in_schema=False)
+
+
+async def require_admin(x_admin_token: str = Header(default='')) -> None:
+    # без настроенного токена отладочных эндпоинтов как будто нет
+    if not settings.admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if not secrets.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+@router.get('/profile', dependencies=[Depends(require_admin)])
+async def profile_worker(
+    seconds: float = Query(default=10.0, gt=0, le=settings.profiler_max_duration),
+    interval: float = Query(default=settings.profiler_interval, ge=0.001, le=1.0),
+) -> PlainTextResponse:
+    try:
+        stacks = await profile(seconds, interval)
+    except ProfilerBusy:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='Profiler is already running')
+
+    return PlainTextResponse(stacks)
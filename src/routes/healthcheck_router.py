@@ -1,10 +1,34 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, status
+from fastapi.responses import UJSONResponse
 
 from typing import Dict
 
+from services.health import check_liveness, check_readiness
+
 router = APIRouter()
 
 
 @router.get('/healthcheck')
 async def healthcheck() -> Dict[str, str]:
-    return {'status': 'ok'}
\ No newline at end of file
+    return {'status': 'ok'}
+
+
+@router.get('/livez')
+async def livez() -> Dict[str, object]:
+    return await check_liveness()
+
+
+@router.get('/readyz')
+async def readyz(request: Request) -> UJSONResponse:
+    if not getattr(request.app.state, 'ready', False):
+        return UJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={'status': 'starting'},
+        )
+
+    ready, checks = await check_readiness()
+
+    return UJSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={'status': 'ok' if ready else 'fail', 'checks': checks},
+    )
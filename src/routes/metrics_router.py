@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from metrics.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get('/metrics', include_in_schema=False)
+async def metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
@@ -1,13 +1,23 @@
+from functools import partial
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.session import get_async_session
+from cache.responses import cached_list_response, cached_response
+from src.session import get_async_session, get_read_session
 from schemas.posts import PostCreate, PostUpdate, PostRead
+from schemas.common import BatchGetRequest, BulkCreate, BulkCreateResult, Page
+from schemas.orders import OrderCreate, OrderRead
+from services.orders import bulk_create_orders, get_orders, list_orders
 from services.posts import (
+    export_posts,
+    bulk_create_posts,
     create_post,
     get_post,
+    get_posts,
+    list_posts,
     update_post,
     delete_post,
 )
@@ -21,24 +31,85 @@ router = APIRouter(
 @router.post("/", response_model=PostRead, status_code=status.HTTP_201_CREATED)
 async def create_post_handler(
     data: PostCreate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     return await create_post(session, data)
 
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def bulk_create_posts_handler(
+    data: BulkCreate[PostCreate],
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+):
+    return await bulk_create_posts(session, data)
+
+
+@router.post("/orders/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def bulk_create_orders_handler(
+    data: BulkCreate[OrderCreate],
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+):
+    return await bulk_create_orders(session, data)
+
+
+@router.get("/", response_model=Page[PostRead], status_code=status.HTTP_200_OK)
+async def list_posts_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_posts(session, limit, cursor)
+
+
+@router.get("/orders", response_model=Page[OrderRead], status_code=status.HTTP_200_OK)
+async def list_orders_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_orders(session, limit, cursor)
+
+
+@router.post("/batch-get", response_model=list[PostRead], status_code=status.HTTP_200_OK)
+async def get_posts_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_posts(session, data.ids))
+
+
+@router.post("/orders/batch-get", response_model=list[OrderRead], status_code=status.HTTP_200_OK)
+async def get_orders_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_orders(session, data.ids))
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_posts_handler(
+    session: AsyncSession = Depends(get_read_session),
+):
+    return StreamingResponse(
+        export_posts(session),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("/{post_id}", response_model=PostRead, status_code=status.HTTP_200_OK)
 async def get_post_handler(
     post_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    return await get_post(session, post_id)
+    return await cached_response(request, partial(get_post, session, post_id))
 
 
 @router.put("/{post_id}", response_model=PostRead, status_code=status.HTTP_200_OK)
 async def update_post_handler(
     post_id: UUID,
     data: PostUpdate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     return await update_post(session, post_id, data)
 
@@ -46,7 +117,7 @@ async def update_post_handler(
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_post_handler(
     post_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     await delete_post(session, post_id)
 
@@ -1,13 +1,22 @@
+from functools import partial
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.session import get_async_session
+from cache.responses import cached_list_response, cached_response
+from src.session import get_async_session, get_read_session
 from schemas.roles import RoleCreate, RoleUpdate, RoleRead
+from schemas.common import BatchGetRequest, Page
+from schemas.comments import CommentRead
+from services.comments import get_comments, list_comments
 from services.roles import (
+    export_roles,
     create_role,
     get_role,
+    get_roles,
+    list_roles,
     update_role,
     delete_role,
 )
@@ -21,24 +30,69 @@ router = APIRouter(
 @router.post("/", response_model=RoleRead, status_code=status.HTTP_201_CREATED)
 async def create_role_handler(
     data: RoleCreate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     return await create_role(session, data)
 
 
+@router.get("/", response_model=Page[RoleRead], status_code=status.HTTP_200_OK)
+async def list_roles_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_roles(session, limit, cursor)
+
+
+@router.get("/comments", response_model=Page[CommentRead], status_code=status.HTTP_200_OK)
+async def list_comments_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_comments(session, limit, cursor)
+
+
+@router.post("/batch-get", response_model=list[RoleRead], status_code=status.HTTP_200_OK)
+async def get_roles_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_roles(session, data.ids))
+
+
+@router.post("/comments/batch-get", response_model=list[CommentRead], status_code=status.HTTP_200_OK)
+async def get_comments_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_comments(session, data.ids))
+
+
+@router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+async def export_roles_handler(
+    session: AsyncSession = Depends(get_read_session),
+):
+    return StreamingResponse(
+        export_roles(session),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("/{role_id}", response_model=RoleRead, status_code=status.HTTP_200_OK)
 async def get_role_handler(
     role_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    return await get_role(session, role_id)
+    return await cached_response(request, partial(get_role, session, role_id))
 
 
 @router.put("/{role_id}", response_model=RoleRead, status_code=status.HTTP_200_OK)
 async def update_role_handler(
     role_id: UUID,
     data: RoleUpdate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     return await update_role(session, role_id, data)
 
@@ -46,7 +100,7 @@ async def update_role_handler(
 @router.delete("/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_role_handler(
     role_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     await delete_role(session, role_id)
 
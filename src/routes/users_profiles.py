@@ -1,12 +1,20 @@
+from functools import partial
 from uuid import UUID
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.session import get_async_session
+from cache.responses import cached_list_response, cached_response
+from src.session import get_async_session, get_read_session
 from schemas.users import UserCreate, UserUpdate, UserRead
+from schemas.common import BatchGetRequest, BulkCreate, BulkCreateResult, Page
+from schemas.profiles import ProfileRead
+from services.profiles import get_profiles, list_profiles
 from services.users import (
+    bulk_create_users,
     create_user,
     get_user,
+    get_users,
+    list_users,
     update_user,
     delete_user,
 )
@@ -20,24 +28,67 @@ router = APIRouter(
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def create_user_handler(
     data: UserCreate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     await create_user(session, data)
 
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def bulk_create_users_handler(
+    data: BulkCreate[UserCreate],
+    session: AsyncSession = Depends(get_async_session, scope="function"),
+):
+    return await bulk_create_users(session, data)
+
+
+@router.get("/", response_model=Page[UserRead], status_code=status.HTTP_200_OK)
+async def list_users_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_users(session, limit, cursor)
+
+
+@router.get("/profiles", response_model=Page[ProfileRead], status_code=status.HTTP_200_OK)
+async def list_profiles_handler(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return await list_profiles(session, limit, cursor)
+
+
+@router.post("/batch-get", response_model=list[UserRead], status_code=status.HTTP_200_OK)
+async def get_users_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_users(session, data.ids))
+
+
+@router.post("/profiles/batch-get", response_model=list[ProfileRead], status_code=status.HTTP_200_OK)
+async def get_profiles_handler(
+    data: BatchGetRequest,
+    session: AsyncSession = Depends(get_read_session),
+):
+    return cached_list_response(await get_profiles(session, data.ids))
+
+
 @router.get("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
 async def get_user_handler(
     user_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    request: Request,
+    session: AsyncSession = Depends(get_read_session),
 ):
-    return await get_user(session, user_id)
+    return await cached_response(request, partial(get_user, session, user_id))
 
 
 @router.put("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
 async def update_user_handler(
     user_id: UUID,
     data: UserUpdate,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     return await update_user(session, user_id, data)
 
@@ -45,6 +96,6 @@ async def update_user_handler(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user_handler(
     user_id: UUID,
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, scope="function"),
 ):
     await delete_user(session, user_id)
@@ -2,7 +2,6 @@ from uuid import UUID
 from pydantic import BaseModel, field_validator, Field
 
 from exceptions.common import ValidationError
-from schemas.roles import RoleRead, RoleCreate
 
 
 class CommentBase(BaseModel):
@@ -51,8 +50,14 @@ class CommentRead(BaseModel):
     id: UUID
     content: str
     is_edited: bool
-    role: RoleRead | None
+    role: "RoleRead | None"
 
     model_config = {
         "from_attributes": True
     }
+
+
+# см. schemas.roles: взаимные ссылки разрешаются после импорта обоих модулей
+from schemas.roles import RoleRead  # noqa: E402
+
+CommentRead.model_rebuild()
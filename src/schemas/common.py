@@ -0,0 +1,51 @@
+from typing import Generic, Literal, TypeVar
+from uuid import UUID
+from pydantic import BaseModel, Field, field_validator
+
+from exceptions.common import ValidationError
+
+T = TypeVar("T")
+
+OnConflict = Literal["error", "ignore", "update"]
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class BatchGetRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=500)
+
+
+class BulkCreate(BaseModel, Generic[T]):
+    items: list[T] = Field(min_length=1, max_length=100_000)
+    on_conflict: OnConflict = "error"
+
+    @field_validator("items")
+    @classmethod
+    def ids_unique(cls, v: list[T]) -> list[T]:
+        # повтор id в одной пачке ON CONFLICT DO UPDATE не переживёт
+        ids = [item.id for item in v if getattr(item, "id", None) is not None]
+        if len(ids) != len(set(ids)):
+            raise ValidationError("Bulk item ids")
+        return v
+
+    @field_validator("items")
+    @classmethod
+    def items_flat(cls, v: list[T]) -> list[T]:
+        # пачка пишет только свою таблицу: вложенные order/profile/post
+        # молча потерялись бы, поэтому отклоняем их явно
+        for item in v:
+            for name, value in item:
+                if isinstance(value, BaseModel):
+                    raise ValidationError(f"Bulk item {name}")
+        return v
+
+
+class BulkCreateResult(BaseModel):
+    received: int
+    written: int
+    method: Literal["insert", "copy"]
+    elapsed_ms: float
+    rows_per_second: float
@@ -2,12 +2,12 @@ from uuid import UUID
 from pydantic import BaseModel, field_validator
 
 from exceptions.common import ValidationError
-from schemas.posts import PostRead, PostCreate
 
 
 class OrderCreate(BaseModel):
+    id: UUID | None = None
     price: int
-    post: PostCreate | None = None
+    post: "PostCreate | None" = None
 
     @field_validator("price")
     @classmethod
@@ -24,8 +24,15 @@ class OrderUpdate(BaseModel):
 class OrderRead(BaseModel):
     id: UUID
     price: int
-    post: PostRead | None = None
+    post: "PostRead | None" = None
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+
+# см. schemas.posts: взаимные ссылки разрешаются после импорта обоих модулей
+from schemas.posts import PostCreate, PostRead  # noqa: E402
+
+OrderCreate.model_rebuild()
+OrderRead.model_rebuild()
@@ -2,13 +2,13 @@ from uuid import UUID
 from pydantic import BaseModel, field_validator
 
 from exceptions.common import ValidationError
-from schemas.orders import OrderCreate
 
 
 class PostCreate(BaseModel):
+    id: UUID | None = None
     title: str
     content: str
-    order: OrderCreate | None = None
+    order: "OrderCreate | None" = None
 
     @field_validator("title")
     @classmethod
@@ -32,3 +32,21 @@ class PostRead(BaseModel):
     }
 
 
+class PostExportOrder(BaseModel):
+    id: UUID
+    price: int
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class PostExport(PostRead):
+    orders: list[PostExportOrder]
+
+
+# схемы постов и заказов ссылаются друг на друга: импорт в конце модуля
+# и отложенные аннотации разрывают цикл при любом порядке импорта
+from schemas.orders import OrderCreate  # noqa: E402
+
+PostCreate.model_rebuild()
@@ -30,8 +30,6 @@ class ProfileRead(BaseModel):
     full_name: str
     bio: str
     owner_id: UUID | None
-    role_id: UUID | None
-    role_o2m_id: UUID | None
 
     class Config:
         from_attributes = True
@@ -1,8 +1,6 @@
 from uuid import UUID
 from pydantic import BaseModel, field_validator
 
-from schemas.comments import CommentCreate
-
 
 class RoleBase(BaseModel):
     name: str
@@ -10,7 +8,7 @@ class RoleBase(BaseModel):
 
 
 class RoleCreate(RoleBase):
-    comment: CommentCreate | None = None
+    comment: "CommentCreate | None" = None
 
 
 class RoleUpdate(BaseModel):
@@ -24,3 +22,24 @@ class RoleRead(RoleBase):
     model_config = {
         "from_attributes": True
     }
+
+
+class RoleExportComment(BaseModel):
+    id: UUID
+    content: str
+    is_edited: bool
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class RoleExport(RoleRead):
+    comments: list[RoleExportComment]
+
+
+# схемы ролей и комментариев ссылаются друг на друга: импорт в конце модуля
+# и отложенные аннотации разрывают цикл при любом порядке импорта
+from schemas.comments import CommentCreate  # noqa: E402
+
+RoleCreate.model_rebuild()
@@ -6,6 +6,7 @@ from schemas.profiles import ProfileCreate
 
 
 class UserCreate(BaseModel):
+    id: UUID | None = None
     name: str
     profile: ProfileCreate | None = None
 
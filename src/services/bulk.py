@@ -0,0 +1,37 @@
+import time
+from typing import Any, Protocol
+
+from config.config import Settings
+from schemas.common import BulkCreateResult, OnConflict
+
+settings = Settings()
+
+
+class BulkRepository(Protocol):
+    async def bulk_create(self, rows: list[dict[str, Any]], on_conflict: str) -> int: ...
+
+    async def copy_rows(self, rows: list[dict[str, Any]]) -> int: ...
+
+
+async def bulk_write(
+    repo: BulkRepository,
+    rows: list[dict[str, Any]],
+    on_conflict: OnConflict,
+) -> BulkCreateResult:
+    # COPY быстрее всего, но не умеет ON CONFLICT
+    use_copy = on_conflict == "error" and len(rows) >= settings.bulk_copy_threshold
+
+    started = time.perf_counter()
+    if use_copy:
+        written = await repo.copy_rows(rows)
+    else:
+        written = await repo.bulk_create(rows, on_conflict)
+    elapsed = time.perf_counter() - started
+
+    return BulkCreateResult(
+        received=len(rows),
+        written=written,
+        method="copy" if use_copy else "insert",
+        elapsed_ms=round(elapsed * 1000, 3),
+        rows_per_second=round(written / elapsed, 1) if elapsed else 0.0,
+    )
@@ -2,10 +2,12 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
 from models.comments import CommentModel
 from repositories.comments import CommentRepository
 from schemas.comments import CommentCreate, CommentUpdate, CommentRead
+from schemas.common import Page
 from exceptions.common import NotFoundError
 import logging
 
@@ -32,28 +34,44 @@ async def create_comment(
 async def get_comment(
     session: AsyncSession,
     comment_id: UUID,
-) -> CommentRead:
-    cache_key = f"comment:{comment_id}"
+) -> CacheEntry:
+    async def load() -> CommentRead:
+        repo = CommentRepository(session)
+        comment = await repo.read_by_id(comment_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return CommentRead.model_validate_json(cached)
+        if comment is None:
+            raise NotFoundError(f"Comment with id={comment_id} not found")
 
-    repo = CommentRepository(session)
-    comment = await repo.get_by_id(comment_id)
+        return CommentRead.model_validate(comment)
 
-    if comment is None:
-        raise NotFoundError(f"Comment with id={comment_id} not found")
+    return await cache.get_or_load(f"comment:{comment_id}", load)
 
-    data = CommentRead.model_validate(comment)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+async def get_comments(
+    session: AsyncSession,
+    comment_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[CommentRead]:
+        repo = CommentRepository(session)
+        comments = await repo.read_many(missing)
 
-    return data
+        return [CommentRead.model_validate(comment) for comment in comments]
+
+    return await cache.get_many_or_load("comment", comment_ids, load)
+
+
+async def list_comments(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[CommentRead]:
+    repo = CommentRepository(session)
+    comments, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[CommentRead](
+        items=[CommentRead.model_validate(comment) for comment in comments],
+        next_cursor=next_cursor,
+    )
 
 
 async def update_comment(
@@ -79,11 +97,7 @@ async def update_comment(
 
     data_read = CommentRead.model_validate(comment)
 
-    await redis.set(
-        f"comment:{comment_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"comment:{comment_id}"])
 
     return data_read
 
@@ -103,9 +117,8 @@ async def delete_comment(
         )
         raise NotFoundError(f"Comment with id {comment_id} not found")
 
-    await redis.delete(f"comment:{comment_id}")
-
     await repo.delete_by_id(comment_id)
+    cache.invalidate_on_commit(session, [f"comment:{comment_id}"])
 
 
 
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import text
+
+from config.config import Settings
+from config.redis import redis
+from src.session import engine, pool_status
+
+settings = Settings()
+
+
+@dataclass
+class LoopLag:
+    current: float = 0.0
+    max: float = 0.0
+
+
+loop_lag = LoopLag()
+
+_readiness: tuple[float, bool, dict] | None = None
+_readiness_lock = asyncio.Lock()
+
+
+async def monitor_loop_lag(interval: float = 0.5) -> None:
+    """Насколько позже запланированного просыпается корутина — это задержка цикла событий."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        loop_lag.current = max(loop.time() - expected, 0.0)
+        loop_lag.max = max(loop_lag.max, loop_lag.current)
+
+
+async def _probe(coro, timeout: float) -> dict:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(coro, timeout=timeout)
+    except Exception as exc:
+        return {"ok": False, "error": type(exc).__name__}
+
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+async def _ping_database() -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def check_liveness() -> dict:
+    return {
+        "status": "ok",
+        "event_loop": {"lag_ms": round(loop_lag.current * 1000, 3)},
+    }
+
+
+async def check_readiness() -> tuple[bool, dict]:
+    """
+    Проверяет БД, Redis, заполненность пула и задержку цикла событий.
+    Результат кэшируется на health_cache_ttl, чтобы частые пробы
+    балансировщика сами не нагружали базу.
+    """
+    global _readiness
+
+    async with _readiness_lock:
+        now = time.monotonic()
+        if _readiness is not None and now - _readiness[0] < settings.health_cache_ttl:
+            return _readiness[1], _readiness[2]
+
+        database, cache = await asyncio.gather(
+            _probe(_ping_database(), settings.health_probe_timeout),
+            _probe(redis.ping(), settings.health_probe_timeout),
+        )
+
+        pool = pool_status(engine)
+        pool["ok"] = pool.get("utilization", 0.0) < settings.health_max_pool_utilization
+
+        event_loop = {
+            "lag_ms": round(loop_lag.current * 1000, 3),
+            "ok": loop_lag.current < settings.health_max_loop_lag,
+        }
+
+        checks = {
+            "database": database,
+            "redis": cache,
+            "pool": pool,
+            "event_loop": event_loop,
+        }
+        ready = all(check["ok"] for check in checks.values())
+
+        _readiness = (now, ready, checks)
+        return ready, checks
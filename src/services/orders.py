@@ -2,10 +2,13 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
 from models.orders import OrderModel
 from repositories.orders import OrderRepository
 from schemas.orders import OrderCreate, OrderUpdate, OrderRead
+from schemas.common import BulkCreate, BulkCreateResult, Page
+from services.bulk import bulk_write
 from exceptions.common import NotFoundError
 import logging
 
@@ -28,31 +31,69 @@ async def create_order(
     return OrderRead.model_validate(order)
 
 
+async def bulk_create_orders(
+    session: AsyncSession,
+    data: BulkCreate[OrderCreate],
+) -> BulkCreateResult:
+    repo = OrderRepository(session)
+
+    rows = [
+        {
+            "id": item.id or uuid4(),
+            "price": item.price,
+        }
+        for item in data.items
+    ]
+
+    result = await bulk_write(repo, rows, data.on_conflict)
+
+    if data.on_conflict == "update":
+        cache.invalidate_on_commit(session, [f"order:{row['id']}" for row in rows])
+
+    return result
+
+
 async def get_order(
     session: AsyncSession,
     order_id: UUID,
-) -> OrderRead:
-    cache_key = f"order:{order_id}"
+) -> CacheEntry:
+    async def load() -> OrderRead:
+        repo = OrderRepository(session)
+        order = await repo.read_by_id(order_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return OrderRead.model_validate_json(cached)
+        if order is None:
+            raise NotFoundError(f"Order with id {order_id} not found")
 
-    repo = OrderRepository(session)
-    order = await repo.get_by_id(order_id)
+        return OrderRead.model_validate(order)
 
-    if order is None:
-        raise NotFoundError(f"Order with id {order_id} not found")
+    return await cache.get_or_load(f"order:{order_id}", load)
 
-    data = OrderRead.model_validate(order)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+async def get_orders(
+    session: AsyncSession,
+    order_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[OrderRead]:
+        repo = OrderRepository(session)
+        orders = await repo.read_many(missing)
+
+        return [OrderRead.model_validate(order) for order in orders]
 
-    return data
+    return await cache.get_many_or_load("order", order_ids, load)
+
+
+async def list_orders(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[OrderRead]:
+    repo = OrderRepository(session)
+    orders, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[OrderRead](
+        items=[OrderRead.model_validate(order) for order in orders],
+        next_cursor=next_cursor,
+    )
 
 
 async def update_order(
@@ -77,11 +118,7 @@ async def update_order(
 
     data_read = OrderRead.model_validate(order)
 
-    await redis.set(
-        f"order:{order_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"order:{order_id}"])
 
     return data_read
 
@@ -101,7 +138,6 @@ async def delete_order(
         )
         raise NotFoundError(message)
 
-    await redis.delete(f"order:{order_id}")
-
     await repo.delete_by_id(order_id)
+    cache.invalidate_on_commit(session, [f"order:{order_id}"])
 
@@ -1,16 +1,24 @@
+from typing import AsyncIterator
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
+from config.config import Settings
 from models.posts import PostModel
+from repositories.fast import read_repository
 from repositories.posts import PostRepository
-from schemas.posts import PostCreate, PostUpdate, PostRead
+from schemas.posts import PostCreate, PostUpdate, PostRead, PostExport
+from schemas.common import BulkCreate, BulkCreateResult, Page
+from services.bulk import bulk_write
 from exceptions.common import NotFoundError
 import logging
 
 logger = logging.getLogger(__name__)
 
+settings = Settings()
+
 
 async def create_post(
     session: AsyncSession,
@@ -29,31 +37,82 @@ async def create_post(
     return PostRead.model_validate(post)
 
 
+async def bulk_create_posts(
+    session: AsyncSession,
+    data: BulkCreate[PostCreate],
+) -> BulkCreateResult:
+    repo = PostRepository(session)
+
+    rows = [
+        {
+            "id": item.id or uuid4(),
+            "title": item.title,
+            "content": item.content,
+        }
+        for item in data.items
+    ]
+
+    result = await bulk_write(repo, rows, data.on_conflict)
+
+    if data.on_conflict == "update":
+        cache.invalidate_on_commit(session, [f"post:{row['id']}" for row in rows])
+
+    return result
+
+
 async def get_post(
     session: AsyncSession,
     post_id: UUID,
-) -> PostRead:
-    cache_key = f"post:{post_id}"
+) -> CacheEntry:
+    async def load() -> PostRead:
+        repo = read_repository(PostRepository, session)
+        post = await repo.read_by_id(post_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return PostRead.model_validate_json(cached)
+        if post is None:
+            raise NotFoundError(f"Post with id {post_id} not found")
 
-    repo = PostRepository(session)
-    post = await repo.get_by_id(post_id)
+        return PostRead.model_validate(post)
 
-    if post is None:
-        raise NotFoundError(f"Post with id {post_id} not found")
+    return await cache.get_or_load(f"post:{post_id}", load)
 
-    data = PostRead.model_validate(post)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
+async def get_posts(
+    session: AsyncSession,
+    post_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[PostRead]:
+        repo = read_repository(PostRepository, session)
+        posts = await repo.read_many(missing)
+
+        return [PostRead.model_validate(post) for post in posts]
+
+    return await cache.get_many_or_load("post", post_ids, load)
+
+
+async def list_posts(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[PostRead]:
+    repo = PostRepository(session)
+    posts, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[PostRead](
+        items=[PostRead.model_validate(post) for post in posts],
+        next_cursor=next_cursor,
     )
 
-    return data
+
+async def export_posts(
+    session: AsyncSession,
+) -> AsyncIterator[bytes]:
+    repo = PostRepository(session)
+
+    async for posts in repo.stream_with_orders(settings.export_batch_size):
+        yield b"".join(
+            PostExport.model_validate(item).model_dump_json().encode() + b"\n"
+            for item in posts
+        )
 
 
 async def update_post(
@@ -79,11 +138,7 @@ async def update_post(
 
     data_read = PostRead.model_validate(post)
 
-    await redis.set(
-        f"post:{post_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"post:{post_id}"])
 
     return data_read
 
@@ -102,9 +157,8 @@ async def delete_post(
         )
         raise NotFoundError(f"Post with id {post_id} not found")
 
-    await redis.delete(f"post:{post_id}")
-
     await repo.delete_by_id(post_id)
+    cache.invalidate_on_commit(session, [f"post:{post_id}"])
 
 
 
@@ -2,10 +2,12 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
 from models.profiles import ProfileModel
 from repositories.profiles import ProfileRepository
 from schemas.profiles import ProfileUpdate, ProfileRead, ProfileCreate
+from schemas.common import Page
 from exceptions.common import NotFoundError
 import logging
 
@@ -34,28 +36,44 @@ async def create_profile(
 async def get_profile(
     session: AsyncSession,
     profile_id: UUID,
-) -> ProfileRead:
-    cache_key = f"profile:{profile_id}"
+) -> CacheEntry:
+    async def load() -> ProfileRead:
+        repo = ProfileRepository(session)
+        profile = await repo.read_by_id(profile_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return ProfileRead.model_validate_json(cached)
+        if profile is None:
+            raise NotFoundError(f"Profile with id {profile_id} not found")
 
-    repo = ProfileRepository(session)
-    profile = await repo.get_by_id(profile_id)
+        return ProfileRead.model_validate(profile)
 
-    if profile is None:
-        raise NotFoundError(f"Profile with id {profile_id} not found")
+    return await cache.get_or_load(f"profile:{profile_id}", load)
 
-    data = ProfileRead.model_validate(profile)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+async def get_profiles(
+    session: AsyncSession,
+    profile_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[ProfileRead]:
+        repo = ProfileRepository(session)
+        profiles = await repo.read_many(missing)
 
-    return data
+        return [ProfileRead.model_validate(profile) for profile in profiles]
+
+    return await cache.get_many_or_load("profile", profile_ids, load)
+
+
+async def list_profiles(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[ProfileRead]:
+    repo = ProfileRepository(session)
+    profiles, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[ProfileRead](
+        items=[ProfileRead.model_validate(profile) for profile in profiles],
+        next_cursor=next_cursor,
+    )
 
 
 async def update_profile(
@@ -81,11 +99,7 @@ async def update_profile(
 
     data_read = ProfileRead.model_validate(profile)
 
-    await redis.set(
-        f"profile:{profile_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"profile:{profile_id}"])
 
     return data_read
 
@@ -104,9 +118,8 @@ async def delete_profile(
         )
         raise NotFoundError(f"Profile with id {profile_id} not found while deleting")
 
-    await redis.delete(f"profile:{profile_id}")
-
     await repo.delete_by_id(profile_id)
+    cache.invalidate_on_commit(session, [f"profile:{profile_id}"])
 
 
 
@@ -1,18 +1,24 @@
+from typing import AsyncIterator
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
+from config.config import Settings
 from models.comments import CommentModel
 from models.roles import RoleModel
 from repositories.roles import RoleRepository
 from schemas.comments import CommentCreate
-from schemas.roles import RoleCreate, RoleUpdate, RoleRead
+from schemas.roles import RoleCreate, RoleUpdate, RoleRead, RoleExport
+from schemas.common import Page
 from exceptions.common import NotFoundError
 import logging
 
 logger = logging.getLogger(__name__)
 
+settings = Settings()
+
 
 async def create_role(
     session: AsyncSession,
@@ -31,36 +37,61 @@ async def create_role(
 async def get_role(
     session: AsyncSession,
     role_id: UUID,
-) -> RoleRead:
-    cache_key = f"role:{role_id}"
+) -> CacheEntry:
+    async def load() -> RoleRead:
+        repo = RoleRepository(session)
+        role = await repo.read_by_id(role_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return RoleRead.model_validate_json(cached)
+        if role is None:
+            message = f"Role with id {role_id} not found"
+            logger.info(
+                message,
+                extra={"role_id": str(role_id)},
+            )
+            raise NotFoundError(message)
 
-    repo = RoleRepository(session)
-    role = await repo.get_by_id(
-        role_id,
-    )
+        return RoleRead.model_validate(role)
 
-    if role is None:
-        message = f"Role with id {role_id} not found"
-        logger.info(
-            message,
-            extra={"role_id": str(role_id)},
-        )
-        raise NotFoundError(message)
+    return await cache.get_or_load(f"role:{role_id}", load)
+
+
+async def get_roles(
+    session: AsyncSession,
+    role_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[RoleRead]:
+        repo = RoleRepository(session)
+        roles = await repo.read_many(missing)
+
+        return [RoleRead.model_validate(role) for role in roles]
+
+    return await cache.get_many_or_load("role", role_ids, load)
 
-    data = RoleRead.model_validate(role)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
+async def list_roles(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[RoleRead]:
+    repo = RoleRepository(session)
+    roles, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[RoleRead](
+        items=[RoleRead.model_validate(role) for role in roles],
+        next_cursor=next_cursor,
     )
 
-    return data
 
+async def export_roles(
+    session: AsyncSession,
+) -> AsyncIterator[bytes]:
+    repo = RoleRepository(session)
+
+    async for roles in repo.stream_with_comments(settings.export_batch_size):
+        yield b"".join(
+            RoleExport.model_validate(item).model_dump_json().encode() + b"\n"
+            for item in roles
+        )
 
 
 async def update_role(
@@ -86,11 +117,7 @@ async def update_role(
 
     data_read = RoleRead.model_validate(role)
 
-    await redis.set(
-        f"role:{role_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"role:{role_id}"])
 
     return data_read
 
@@ -109,9 +136,8 @@ async def delete_role(
         )
         raise NotFoundError(f"Role with id {role_id} not found")
 
-    await redis.delete(f"role:{role_id}")
-
     await repo.delete_by_id(role_id)
+    cache.invalidate_on_commit(session, [f"role:{role_id}"])
 
 
 
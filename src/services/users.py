@@ -2,12 +2,16 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.redis import redis, CACHE_TTL
+from cache.cache import cache
+from cache.entry import CacheEntry
 from models.profiles import ProfileModel
 from models.users import UserModel
+from repositories.fast import read_repository
 from repositories.users import UserRepository
 from schemas.profiles import ProfileCreate
 from schemas.users import UserCreate, UserRead, UserUpdate
+from schemas.common import BulkCreate, BulkCreateResult, Page
+from services.bulk import bulk_write
 from exceptions.common import NotFoundError
 import logging
 
@@ -29,38 +33,74 @@ async def create_user(
     return UserRead.model_validate(user)
 
 
+async def bulk_create_users(
+    session: AsyncSession,
+    data: BulkCreate[UserCreate],
+) -> BulkCreateResult:
+    repo = UserRepository(session)
+
+    rows = [
+        {
+            "id": item.id or uuid4(),
+            "name": item.name,
+        }
+        for item in data.items
+    ]
+
+    result = await bulk_write(repo, rows, data.on_conflict)
+
+    if data.on_conflict == "update":
+        cache.invalidate_on_commit(session, [f"user:{row['id']}" for row in rows])
+
+    return result
+
+
 async def get_user(
     session: AsyncSession,
     user_id: UUID,
-) -> UserRead:
-    cache_key = f"user:{user_id}"
+) -> CacheEntry:
+    async def load() -> UserRead:
+        repo = read_repository(UserRepository, session)
+        user = await repo.read_by_id(user_id)
 
-    cached = await redis.get(cache_key)
-    if cached:
-        return UserRead.model_validate_json(cached)
+        if user is None:
+            message = f"User with id {user_id} not found"
+            logger.info(
+                message,
+                extra={"user_id": str(user_id)},
+            )
+            raise NotFoundError(message)
 
-    repo = UserRepository(session)
-    user = await repo.get_by_id(
-        user_id,
-    )
+        return UserRead.model_validate(user)
 
-    if user is None:
-        message = f"User with id {user_id} not found"
-        logger.info(
-            message,
-            extra={"user_id": str(user_id)},
-        )
-        raise NotFoundError(message)
+    return await cache.get_or_load(f"user:{user_id}", load)
 
-    data = UserRead.model_validate(user)
 
-    await redis.set(
-        cache_key,
-        data.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+async def get_users(
+    session: AsyncSession,
+    user_ids: list[UUID],
+) -> list[CacheEntry]:
+    async def load(missing: list[UUID]) -> list[UserRead]:
+        repo = read_repository(UserRepository, session)
+        users = await repo.read_many(missing)
+
+        return [UserRead.model_validate(user) for user in users]
+
+    return await cache.get_many_or_load("user", user_ids, load)
 
-    return data
+
+async def list_users(
+    session: AsyncSession,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[UserRead]:
+    repo = UserRepository(session)
+    users, next_cursor = await repo.read_page(limit, cursor)
+
+    return Page[UserRead](
+        items=[UserRead.model_validate(user) for user in users],
+        next_cursor=next_cursor,
+    )
 
 
 async def update_user(
@@ -87,11 +127,7 @@ async def update_user(
 
     data_read = UserRead.model_validate(user)
 
-    await redis.set(
-        f"user:{user_id}",
-        data_read.model_dump_json(),
-        ex=CACHE_TTL,
-    )
+    cache.invalidate_on_commit(session, [f"user:{user_id}"])
 
     return data_read
 
@@ -112,9 +148,8 @@ async def delete_user(
         )
         raise NotFoundError(f"User with id {user_id} not found")
 
-    await redis.delete(f"user:{user_id}")
-
     await repo.delete_by_id(user_id)
+    cache.invalidate_on_commit(session, [f"user:{user_id}"])
 
 
 
@@ -1,28 +1,238 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, asdict
+from uuid import uuid4
+
+from fastapi import Request
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from cache.cache import cache, read_source
 from config.config import Settings
 
+logger = logging.getLogger(__name__)
+
 settings = Settings()
 
-engine = create_async_engine(
-    str(settings.postgres_url),
-    echo=False,
+PRIMARY_COOKIE = "db_primary_until"
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_checkout(self, waited: float, overflow: bool) -> None:
+        self.checkouts += 1
+        self.overflow_checkouts += overflow
+        self.wait_time_total += waited
+        self.wait_time_max = max(self.wait_time_max, waited)
+
+
+# по пулу на роль базы: primary и replica считаются раздельно
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Пул, который считает выдачи соединений и время ожидания свободного.
+    Роль задаёт подкласс из build_engine: recreate() при dispose создаёт
+    пул того же класса, и метрики не теряются.
+    """
+
+    role: str = "primary"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # время установки новых соединений по id записи: в ожидание не входит
+        self._connect_times: dict[int, float] = {}
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        self._connect_times[id(record)] = time.perf_counter() - started
+        return record
+
+    def _do_get(self):
+        metrics = pool_metrics[self.role]
+        overflow = self.overflow()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+
+        waited = time.perf_counter() - started - self._connect_times.pop(id(connection), 0.0)
+        # сверх pool_size открыто новое соединение именно этой выдачей
+        metrics.record_checkout(max(waited, 0.0), self.overflow() > max(overflow, 0))
+        return connection
+
+
+def build_engine(url: str, role: str = "primary") -> AsyncEngine:
+    connect_args = {
+        "server_settings": settings.db_server_settings,
+        "command_timeout": settings.db_command_timeout,
+    }
+
+    if settings.db_external_pooler:
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+        return create_async_engine(
+            make_url(url).update_query_dict({"prepared_statement_cache_size": "0"}),
+            poolclass=NullPool,
+            connect_args=connect_args,
+            query_cache_size=settings.db_query_cache_size,
+            echo=False,
+        )
+
+    pool_metrics.setdefault(role, PoolMetrics())
+    return create_async_engine(
+        make_url(url).update_query_dict(
+            {"prepared_statement_cache_size": str(settings.db_statement_cache_size)},
+        ),
+        poolclass=type(f"{role.title()}Pool", (InstrumentedPool,), {"role": role}),
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+        query_cache_size=settings.db_query_cache_size,
+        echo=False,
+    )
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, float]:
+    pool = engine.pool
+    status = asdict(pool_metrics.get(getattr(pool, "role", None), PoolMetrics()))
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        capacity = pool.size() + max(settings.db_max_overflow, 0)
+        status.update(
+            size=pool.size(),
+            max_overflow=settings.db_max_overflow,
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            utilization=pool.checkedout() / capacity if capacity else 0.0,
+        )
+
+    return status
+
+
+@dataclass
+class ReplicaState:
+    healthy: bool = False
+    lag: float | None = None
+
+
+replica_state = ReplicaState()
+
+# на реплике без новых записей replay_timestamp стоит на месте,
+# поэтому при совпадении LSN считаем отставание нулевым
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END"
 )
 
+
+engine = build_engine(str(settings.postgres_url), "primary")
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
+replica_engine = (
+    build_engine(settings.postgres_replica_url, "replica")
+    if settings.postgres_replica_url
+    else None
+)
+
+# чтения идут в autocommit: драйвер не шлёт BEGIN/COMMIT/ROLLBACK,
+# а соединение берётся из пула только при первом запросе к БД
+primary_read_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+read_session_maker = (
+    async_sessionmaker(
+        replica_engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    if replica_engine is not None
+    else primary_read_session_maker
+)
+
+
+async def monitor_replica_lag() -> None:
+    """Фоновая проверка реплики: при отставании чтение уходит на primary."""
+    while True:
+        try:
+            async with replica_engine.connect() as connection:
+                lag = await asyncio.wait_for(
+                    connection.scalar(REPLICA_LAG_QUERY),
+                    timeout=settings.replica_lag_check_interval,
+                )
+            replica_state.lag = float(lag or 0)
+            replica_state.healthy = replica_state.lag <= settings.replica_max_lag
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if replica_state.healthy:
+                logger.warning("Replica is unavailable, reading from primary", exc_info=True)
+            replica_state.healthy = False
+
+        await asyncio.sleep(settings.replica_lag_check_interval)
+
+
+def _read_from_primary(request: Request) -> bool:
+    if replica_engine is None or not replica_state.healthy:
+        return True
+
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_session(request: Request) -> AsyncSession:
+    if _read_from_primary(request):
+        maker = primary_read_session_maker
+        read_source.set("primary")
+    else:
+        maker = read_session_maker
+        read_source.set("replica")
+
+    async with maker() as session:
+        yield session
+
+
+async def get_async_session(request: Request) -> AsyncSession:
+    # подключается с Depends(..., scope="function"): коммит проходит до
+    # отправки ответа, и клиент не получит успех для несохранённой записи.
+    # Клиент, который только что писал, какое-то время читает с primary
+    request.state.db_write = True
 
-async def get_async_session() -> AsyncSession:
     async with async_session_maker() as session:
         try:
             yield session
             await session.commit()
+            await cache.invalidate_committed(session)
         except:
             await session.rollback()
             raise
-        finally:
-            await session.close()
-
@@ -0,0 +1,99 @@
+"""
+Сравнивает стратегии загрузки связей RoleRepository.get_by_id
+(selectin / joined / aggregate) при разном числе дочерних комментариев.
+
+    PYTHONPATH=src python -m tools.bench_load_strategies --sizes 1 10 100 1000
+
+Данные создаются внутри транзакции и откатываются в конце.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from metrics.database import QueryStats, instrument_engine, request_queries
+import models.registry  # noqa: F401 регистрация моделей
+from models.comments import CommentModel
+from models.roles import RoleModel, roles_comments_m2m
+from repositories.loading import STRATEGIES, load_one
+from src.session import engine
+
+RELATIONSHIPS = (
+    RoleModel.main_comment,
+    RoleModel.comments,
+    RoleModel.shared_comments,
+)
+
+
+async def seed(session: AsyncSession, size: int):
+    role_id = uuid4()
+    await session.execute(insert(RoleModel), [{"id": role_id, "name": f"bench-{size}"}])
+
+    rows = [
+        {"id": uuid4(), "content": "x" * 64, "is_edited": False, "role_o2m_id": role_id}
+        for _ in range(size)
+    ]
+    rows.append({"id": uuid4(), "content": "main", "is_edited": False, "role_o2o_id": role_id})
+    await session.execute(insert(CommentModel), rows)
+    await session.execute(
+        insert(roles_comments_m2m),
+        [{"role_id": role_id, "comment_id": row["id"]} for row in rows[:size]],
+    )
+
+    return role_id
+
+
+async def measure(session: AsyncSession, role_id, strategy: str, iterations: int):
+    timings = []
+    stats = QueryStats()
+    token = request_queries.set(stats)
+    try:
+        for _ in range(iterations):
+            session.expunge_all()
+            started = time.perf_counter()
+            await load_one(session, RoleModel, role_id, RELATIONSHIPS, strategy)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        request_queries.reset(token)
+
+    timings.sort()
+    return (
+        statistics.median(timings),
+        timings[int(len(timings) * 0.95) - 1],
+        stats.count / iterations,
+    )
+
+
+async def main(sizes: list[int], iterations: int) -> None:
+    instrument_engine(engine)
+
+    print(f"{'children':>8}  {'strategy':<10} {'median ms':>10} {'p95 ms':>10} {'queries':>8}")
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            for size in sizes:
+                role_id = await seed(session, size)
+                for strategy in STRATEGIES:
+                    # прогрев: кэш подготовленных выражений и компиляции
+                    await measure(session, role_id, strategy, 3)
+                    median, p95, queries = await measure(session, role_id, strategy, iterations)
+                    print(f"{size:>8}  {strategy:<10} {median:>10.2f} {p95:>10.2f} {queries:>8.0f}")
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.iterations))
@@ -0,0 +1,86 @@
+"""
+Микробенчмарк Python-накладных на построение запросов репозиториев,
+без БД: сборка выражения на каждый вызов против заранее построенного,
+плюс вычисление ключа кэша компиляции, которое SQLAlchemy делает при
+каждом execute. Для сравнения — цена компиляции при промахе кэша
+(её и должен предотвращать DB_QUERY_CACHE_SIZE).
+
+    PYTHONPATH=src python -m tools.bench_statements
+"""
+import timeit
+from uuid import uuid4
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import selectinload
+
+import models.registry  # noqa: F401 регистрация моделей
+from models.posts import PostModel
+from models.roles import RoleModel
+from repositories.filters import id_any
+from repositories.loading import _statement
+from repositories.posts import READ_BY_ID, READ_COLUMNS, READ_MANY
+
+ROLE_RELATIONSHIPS = (
+    RoleModel.main_comment,
+    RoleModel.comments,
+    RoleModel.shared_comments,
+)
+
+DIALECT = postgresql.dialect()
+
+
+def inline_read_by_id():
+    return select(*READ_COLUMNS).where(PostModel.id == uuid4())._generate_cache_key()
+
+
+def prebuilt_read_by_id():
+    return READ_BY_ID._generate_cache_key()
+
+
+def inline_read_many():
+    return select(*READ_COLUMNS).where(
+        id_any(PostModel.id).params(ids=[uuid4()]),
+    )._generate_cache_key()
+
+
+def prebuilt_read_many():
+    return READ_MANY._generate_cache_key()
+
+
+def inline_get_by_id():
+    return (
+        select(RoleModel)
+        .where(RoleModel.id == bindparam("id"))
+        .options(*(selectinload(relationship) for relationship in ROLE_RELATIONSHIPS))
+    )._generate_cache_key()
+
+
+def prebuilt_get_by_id():
+    return _statement(RoleModel, ROLE_RELATIONSHIPS, "selectin")._generate_cache_key()
+
+
+def compile_get_by_id():
+    return _statement(RoleModel, ROLE_RELATIONSHIPS, "selectin").compile(dialect=DIALECT)
+
+
+def report(name: str, func, number: int) -> None:
+    func()
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<24} {best * 1_000_000:>9.1f} µs/call")
+
+
+def main() -> None:
+    number = 5_000
+
+    report("read_by_id inline", inline_read_by_id, number)
+    report("read_by_id prebuilt", prebuilt_read_by_id, number)
+    report("read_many inline", inline_read_many, number)
+    report("read_many prebuilt", prebuilt_read_many, number)
+    report("get_by_id inline", inline_get_by_id, number)
+    report("get_by_id prebuilt", prebuilt_get_by_id, number)
+    report("compile (cache miss)", compile_get_by_id, number // 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Сверяет asyncpg-репозитории с ORM-реализацией на живой базе: для
+выборки id (и одного несуществующего) read_by_id и read_many обеих
+версий должны давать одинаковые *Read-модели.
+
+    PYTHONPATH=src python -m tools.check_fast_path --sample 200
+
+Код возврата 1 при любом расхождении.
+"""
+import argparse
+import asyncio
+import sys
+from uuid import uuid4
+
+import models.registry  # noqa: F401 регистрация моделей
+from repositories.fast import FAST_REPOSITORIES, close_pools, open_pools, pools
+from repositories.posts import PostRepository
+from repositories.users import UserRepository
+from schemas.posts import PostRead
+from schemas.users import UserRead
+from src.session import engine, primary_read_session_maker
+
+CASES = (
+    (PostRepository, PostRead),
+    (UserRepository, UserRead),
+)
+
+
+def validate(schema, item):
+    return None if item is None else schema.model_validate(item).model_dump()
+
+
+async def check(repository_class, schema, sample: int) -> list[str]:
+    errors = []
+    name = repository_class.__name__
+
+    async with primary_read_session_maker() as session:
+        orm = repository_class(session)
+        fast = FAST_REPOSITORIES[name](pools[str(engine.url)])
+
+        rows, _ = await orm.read_page(sample)
+        ids = [row.id for row in rows] + [uuid4()]
+
+        for entity_id in ids:
+            expected = validate(schema, await orm.read_by_id(entity_id))
+            actual = validate(schema, await fast.read_by_id(entity_id))
+            if expected != actual:
+                errors.append(f"{name}.read_by_id({entity_id}): {expected} != {actual}")
+
+        expected = sorted(
+            (validate(schema, item) for item in await orm.read_many(ids)),
+            key=lambda item: item["id"],
+        )
+        actual = sorted(
+            (validate(schema, item) for item in await fast.read_many(ids)),
+            key=lambda item: item["id"],
+        )
+        if expected != actual:
+            errors.append(f"{name}.read_many: {len(expected)} rows vs {len(actual)} rows or different content")
+
+    print(f"{name}: {len(ids)} ids checked, {len(errors)} mismatches")
+    return errors
+
+
+async def main(sample: int) -> int:
+    await open_pools([engine])
+    try:
+        errors = []
+        for repository_class, schema in CASES:
+            errors.extend(await check(repository_class, schema, sample))
+    finally:
+        await close_pools()
+        await engine.dispose()
+
+    for error in errors:
+        print(error)
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sample", type=int, default=100)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.sample)))
@@ -0,0 +1,126 @@
+"""
+Проверяет, что колонки, по которым ходят связи моделей, покрыты индексами.
+
+Запуск из корня репозитория:
+
+    PYTHONPATH=src python -m tools.index_advisor
+
+Код возврата 1, если хотя бы одной колонке индекс нужен, но его нет —
+годится как шаг CI после миграций.
+"""
+import asyncio
+import sys
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.exc import ArgumentError, InvalidRequestError
+from sqlalchemy.orm import MANYTOMANY, ONETOMANY, configure_mappers
+
+from config.config import Settings
+from src.models.base import Base
+import models.registry  # noqa: F401 регистрация моделей
+
+INDEXES_QUERY = text("""
+    SELECT t.relname AS table_name,
+           i.relname AS index_name,
+           array_agg(a.attname ORDER BY k.ord) AS columns
+    FROM pg_index ix
+    JOIN pg_class t ON t.oid = ix.indrelid
+    JOIN pg_class i ON i.oid = ix.indexrelid
+    JOIN pg_namespace n ON n.oid = t.relnamespace
+    CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord)
+    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+    WHERE n.nspname = current_schema() AND ix.indisvalid
+    GROUP BY t.relname, i.relname
+""")
+
+
+@dataclass(frozen=True)
+class Requirement:
+    table: str
+    columns: tuple[str, ...]
+    reason: str
+
+
+def required_indexes() -> list[Requirement]:
+    """
+    Колонки, по которым фильтруют загрузки связей (selectinload, lazy)
+    и каскадные удаления: дальняя сторона one-to-many, колонка
+    связующей таблицы many-to-many и вообще любой внешний ключ.
+    """
+    found: dict[tuple[str, tuple[str, ...]], Requirement] = {}
+
+    def add(table: str, columns, reason: str) -> None:
+        key = (table, tuple(columns))
+        found.setdefault(key, Requirement(table, tuple(columns), reason))
+
+    for mapper in Base.registry.mappers:
+        for prop in mapper.relationships:
+            reason = f"{mapper.class_.__name__}.{prop.key}"
+            if prop.direction is ONETOMANY:
+                remote = [column for _, column in prop.local_remote_pairs]
+                add(remote[0].table.name, [column.name for column in remote], reason)
+            elif prop.direction is MANYTOMANY:
+                remote = [column for _, column in prop.synchronize_pairs]
+                add(prop.secondary.name, [column.name for column in remote], reason)
+
+    for table in Base.metadata.sorted_tables:
+        for constraint in table.foreign_key_constraints:
+            add(table.name, constraint.column_keys, f"FK {constraint.name or table.name}")
+
+    return list(found.values())
+
+
+def is_covered(requirement: Requirement, indexes: dict[str, list[tuple[str, ...]]]) -> bool:
+    # индекс подходит, если нужные колонки — его префикс
+    width = len(requirement.columns)
+    return any(
+        set(columns[:width]) == set(requirement.columns)
+        for columns in indexes.get(requirement.table, [])
+    )
+
+
+async def main() -> int:
+    # ошибки в описании связей всплывают только при конфигурации мапперов
+    try:
+        configure_mappers()
+    except (ArgumentError, InvalidRequestError) as error:
+        print(f"model mapping is broken, fix it before checking indexes:\n    {error}", file=sys.stderr)
+        return 2
+
+    settings = Settings()
+    engine = create_async_engine(str(settings.postgres_url))
+
+    try:
+        async with engine.connect() as connection:
+            rows = (await connection.execute(INDEXES_QUERY)).all()
+    finally:
+        await engine.dispose()
+
+    indexes: dict[str, list[tuple[str, ...]]] = {}
+    for row in rows:
+        indexes.setdefault(row.table_name, []).append(tuple(row.columns))
+
+    missing = [
+        requirement
+        for requirement in required_indexes()
+        if not is_covered(requirement, indexes)
+    ]
+
+    for requirement in missing:
+        columns = ", ".join(requirement.columns)
+        name = f"ix_{requirement.table}_{'_'.join(requirement.columns)}"
+        print(
+            f"missing index on {requirement.table}({columns}) for {requirement.reason}:\n"
+            f"    CREATE INDEX CONCURRENTLY {name} ON {requirement.table} ({columns});",
+        )
+
+    if not missing:
+        print("all relationship columns are indexed")
+
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
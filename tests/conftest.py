@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# приложение импортирует и src.*, и модули из src напрямую
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "src"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
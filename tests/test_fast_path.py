@@ -0,0 +1,38 @@
+"""
+Паритет asyncpg-репозиториев с ORM: read_by_id и read_many обеих версий
+должны давать одинаковые *Read-модели. Нужна живая база из POSTGRES_URL,
+без неё тесты пропускаются.
+"""
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("asyncpg")
+
+if not os.environ.get("POSTGRES_URL"):
+    pytest.skip("POSTGRES_URL is not set", allow_module_level=True)
+
+from tools.check_fast_path import CASES, check  # noqa: E402
+from repositories.fast import close_pools, open_pools  # noqa: E402
+from src.session import engine  # noqa: E402
+
+
+async def run_check(repository_class, schema) -> list[str]:
+    await open_pools([engine])
+    try:
+        return await check(repository_class, schema, sample=50)
+    finally:
+        await close_pools()
+        # соединения asyncpg привязаны к циклу, который закрывает asyncio.run
+        await engine.dispose()
+
+
+@pytest.mark.parametrize(
+    ("repository_class", "schema"),
+    CASES,
+    ids=[repository_class.__name__ for repository_class, _ in CASES],
+)
+def test_fast_repository_matches_orm(repository_class, schema):
+    assert asyncio.run(run_check(repository_class, schema)) == []
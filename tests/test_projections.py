@@ -0,0 +1,21 @@
+"""
+Строки проекций репозиториев должны проходить валидацию схем *Read:
+каждое обязательное поле схемы обязано быть среди выбранных колонок.
+"""
+from collections import namedtuple
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("prometheus_client")
+
+from repositories.profiles import READ_COLUMNS  # noqa: E402
+from schemas.profiles import ProfileRead  # noqa: E402
+
+
+def test_profile_read_accepts_projected_row():
+    Row = namedtuple("Row", [column.key for column in READ_COLUMNS])
+    row = Row(id=uuid4(), full_name="Ada Lovelace", bio="", owner_id=uuid4())
+
+    assert ProfileRead.model_validate(row).model_dump() == row._asdict()